@@ -2,7 +2,6 @@
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-import operator as op
 
 from .models import Alert, AlertThreshold, Channel, Video, ChannelStats
 
@@ -11,13 +10,7 @@ class AlertManager:
     """Manages alert thresholds and triggers alerts when conditions are met"""
 
     # Operator mapping
-    OPERATORS = {
-        ">=": op.ge,
-        "<=": op.le,
-        ">": op.gt,
-        "<": op.lt,
-        "==": op.eq,
-    }
+    OPERATORS = AlertThreshold.OPERATORS
 
     def __init__(self, thresholds: List[AlertThreshold]):
         """
@@ -150,10 +143,7 @@ class AlertManager:
 
     def _check_threshold(self, value: float, threshold: AlertThreshold) -> bool:
         """Check if value meets threshold condition"""
-        operator_func = self.OPERATORS.get(threshold.operator)
-        if not operator_func:
-            return False
-        return operator_func(value, threshold.value)
+        return threshold.check(value)
 
     def _format_message(self, template: str, name: str, actual: float, threshold: float) -> str:
         """Format alert message with actual values"""
@@ -2,9 +2,12 @@
 
 import asyncio
 import sys
+from io import StringIO
 from typing import Optional, Dict, List
 from datetime import datetime
 
+import plotext as plt
+
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Header, Footer, Static, Label
@@ -19,7 +22,8 @@ from .widgets import (
     DashboardWidget, ChannelDetailWidget, VideoListWidget, TopFlopWidget,
     ChannelsListPanel, VideosListPanel, VideoDetailsPanel, MainViewPanel,
     TemporalAnalysisPanel, ChannelComparisonPanel, TitleTagAnalysisPanel,
-    GrowthProjectionPanel, CommentsSentimentPanel, ChannelSentimentPanel
+    GrowthProjectionPanel, CommentsSentimentPanel, ChannelSentimentPanel,
+    PLOT_LOCK
 )
 from .alerts import AlertManager
 from .temporal_analysis import TemporalAnalyzer
@@ -1382,15 +1386,33 @@ class SuperTubeApp(App):
     async def _update_video_graph(self, widget: Static, history: list) -> None:
         """Update widget with video statistics graph"""
         try:
-            import plotext as plt
-            from io import StringIO
-
             # Extract data for plotting
             dates = [stat.timestamp.strftime("%m-%d") for stat in history]
             views = [stat.view_count for stat in history]
             likes = [stat.like_count for stat in history]
             comments = [stat.comment_count for stat in history]
 
+            # plotext rendering is synchronous: keep it off the event loop
+            views_graph, engagement_graph = await asyncio.to_thread(
+                self._render_video_graphs, dates, views, likes, comments
+            )
+
+            # Display both graphs
+            widget.update(
+                f"[dim]📊 Stats - {len(history)} pts[/dim]\n\n"
+                f"{views_graph}\n\n{engagement_graph}"
+            )
+        except Exception as e:
+            widget.update(
+                "[dim]📊 Video Statistics Trends[/dim]\n"
+                f"[red]Error rendering graph: {e}[/red]"
+            )
+
+    @staticmethod
+    def _render_video_graphs(dates: List[str], views: List[int], likes: List[int],
+                             comments: List[int]) -> tuple:
+        """Render the views and engagement graphs with plotext"""
+        with PLOT_LOCK:
             # Create views graph (smaller size for 50% width column)
             plt.clf()
             plt.title("Views (30d)")
@@ -1400,6 +1422,7 @@ class SuperTubeApp(App):
             plt.theme("dark")
             plt.plotsize(50, 8)
 
+            # One buffer captures both graphs
             buffer = StringIO()
             plt.show(buffer)
             views_graph = buffer.getvalue()
@@ -1414,20 +1437,12 @@ class SuperTubeApp(App):
             plt.theme("dark")
             plt.plotsize(50, 8)
 
-            buffer = StringIO()
+            buffer.seek(0)
+            buffer.truncate(0)
             plt.show(buffer)
             engagement_graph = buffer.getvalue()
 
-            # Display both graphs
-            widget.update(
-                f"[dim]📊 Stats - {len(history)} pts[/dim]\n\n"
-                f"{views_graph}\n\n{engagement_graph}"
-            )
-        except Exception as e:
-            widget.update(
-                "[dim]📊 Video Statistics Trends[/dim]\n"
-                f"[red]Error rendering graph: {e}[/red]"
-            )
+        return views_graph, engagement_graph
 
     def show_topflop_view(self, channel_id: str) -> None:
         """Show Top/Flop analysis view for a channel"""
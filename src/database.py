@@ -3,6 +3,7 @@
 import json
 import zlib
 from datetime import datetime, timedelta
+from operator import attrgetter, itemgetter
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
@@ -512,7 +513,7 @@ class DatabaseManager:
                             ))
 
         # Sort all stats by timestamp
-        stats.sort(key=lambda s: s.timestamp)
+        stats.sort(key=attrgetter("timestamp"))
         return stats
 
     async def cleanup_old_history(self, days: int = 365) -> int:
@@ -809,7 +810,7 @@ class DatabaseManager:
                             ))
 
         # Sort all stats by timestamp
-        stats.sort(key=lambda s: s.timestamp)
+        stats.sort(key=attrgetter("timestamp"))
         return stats
 
     async def detect_changes(self, channel_id: str, new_channel: Channel, new_videos: List[Video]) -> ChangeDetection:
@@ -938,7 +939,7 @@ class DatabaseManager:
                         video_growth.append((video, growth))
 
             # Sort by growth (descending) and return top N
-            video_growth.sort(key=lambda x: x[1], reverse=True)
+            video_growth.sort(key=itemgetter(1), reverse=True)
             return video_growth[:limit]
 
     async def get_bottom_videos_by_growth(
@@ -1000,7 +1001,7 @@ class DatabaseManager:
                         video_growth.append((video, growth))
 
             # Sort by growth (ascending) and return bottom N
-            video_growth.sort(key=lambda x: x[1])
+            video_growth.sort(key=itemgetter(1))
             return video_growth[:limit]
 
     async def save_alert(self, alert: Alert) -> int:
@@ -1303,7 +1304,7 @@ class DatabaseManager:
                                 word_freq[word] = word_freq.get(word, 0) + 1
 
                     # Get top 5 keywords
-                    top_keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:5]
+                    top_keywords = sorted(word_freq.items(), key=itemgetter(1), reverse=True)[:5]
 
                 return VideoSentiment(
                     video_id=video_id,
@@ -1375,7 +1376,7 @@ class DatabaseManager:
                                 videos_with_negative.append((vid_id, negative_percent))
 
                 # Sort by negative percentage
-                videos_with_negative.sort(key=lambda x: x[1], reverse=True)
+                videos_with_negative.sort(key=itemgetter(1), reverse=True)
 
                 return ChannelSentiment(
                     channel_id=channel_id,
@@ -2,6 +2,7 @@
 
 from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
+from operator import attrgetter
 
 from .models import ChannelStats, GrowthProjection, MilestoneProjection
 
@@ -16,7 +17,7 @@ class GrowthPredictor:
         Args:
             history: List of ChannelStats objects, ordered by timestamp
         """
-        self.history = sorted(history, key=lambda s: s.timestamp)
+        self.history = sorted(history, key=attrgetter("timestamp"))
 
     def _calculate_confidence(self, data_points: int, r_squared: float) -> float:
         """
@@ -1,8 +1,45 @@
 """Data models for SuperTube"""
 
-from dataclasses import dataclass, asdict
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import sys
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
+from operator import attrgetter, eq, ge, gt, le, lt
+from typing import Optional, List, Dict, Any, Callable
+
+# Videos published within this window get the "new" badge
+RECENT_VIDEO_WINDOW = timedelta(days=7)
+
+_by_timestamp = attrgetter('timestamp')
+
+# Rich markup of the dashboard stats section and the video details panel, filled with str.format_map
+_CHANNEL_STATS_TEMPLATE = """[bold cyan]📊 {name}[/bold cyan]
+
+[bold yellow]Stats:[/bold yellow]
+Subscribers:  [green]{subscribers:,}[/green]
+Total Views:  [yellow]{views:,}[/yellow]
+Videos:       [blue]{videos:,}[/blue]
+Avg Views/Vid: [yellow]{avg_views:,}[/yellow]
+"""
+_VIDEO_DETAILS_TEMPLATE = """[bold]{title}...[/bold]
+{published} | {duration}
+[yellow]V:[/yellow]{views:,} [green]L:[/green]{likes:,} [blue]C:[/blue]{comments:,}
+[magenta]Rate:[/magenta]{engagement_rate:.1f}% [magenta]C/1k:[/magenta]{comments_per_1k:.0f}"""
+
+
+@lru_cache(maxsize=4096)
+def compact_count(count: int) -> str:
+    """Format a count in the short sidebar style (999, 15.3K, 2.0M), cached across reloads"""
+    if count >= 1000000:
+        return f"{count / 1000000:.1f}M"
+    if count >= 1000:
+        return f"{count / 1000:.1f}K"
+    return str(count)
+
+
+def _clip(text: str, limit: int) -> str:
+    """Cut text longer than `limit` to limit - 2 characters plus '..'"""
+    return text[:limit - 2] + ".." if len(text) > limit else text
 
 
 @dataclass
@@ -18,6 +55,45 @@ class Channel:
     published_at: datetime
     thumbnail_url: Optional[str] = None
 
+    # Counts are never mutated after construction, so the display strings are cached
+    @cached_property
+    def subs_display(self) -> str:
+        """Subscriber count in compact form (e.g. 15.3K)"""
+        return compact_count(self.subscriber_count)
+
+    @cached_property
+    def subs_cell(self) -> str:
+        """Subscriber count as a colored table cell"""
+        return f"[green]{self.subs_display}[/green]"
+
+    @cached_property
+    def display_name(self) -> str:
+        """Channel name clipped to the sidebar column width"""
+        return _clip(self.name, 20)
+
+    @cached_property
+    def sort_name(self) -> str:
+        """Case-insensitive sort key for the channel name"""
+        return self.name.casefold()
+
+    @cached_property
+    def short_description(self) -> str:
+        """Description cut to 200 characters for the channel info box"""
+        if len(self.description) > 200:
+            return self.description[:200] + "..."
+        return self.description
+
+    @cached_property
+    def stats_markup(self) -> str:
+        """Stats section of the main dashboard view (Rich markup)"""
+        return _CHANNEL_STATS_TEMPLATE.format_map({
+            "name": self.name,
+            "subscribers": self.subscriber_count,
+            "views": self.view_count,
+            "videos": self.video_count,
+            "avg_views": self.view_count // max(self.video_count, 1),
+        })
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         data = asdict(self)
@@ -46,33 +122,106 @@ class Video:
     duration: str  # ISO 8601 duration format (e.g., "PT4M13S")
     thumbnail_url: Optional[str] = None
 
-    @property
+    def __post_init__(self):
+        """Intern the channel ID and remember the timestamp's timezone"""
+        # The channel ID repeats across every video of a channel
+        self.channel_id = sys.intern(self.channel_id)
+        # datetime.now(None) is naive local time, matching naive published_at values
+        self._tz = self.published_at.tzinfo
+
+    # Counts are never mutated after construction, so the ratios are cached
+    @cached_property
     def engagement_rate(self) -> float:
         """Calculate engagement rate (likes + comments) / views"""
         if self.view_count == 0:
             return 0.0
         return ((self.like_count + self.comment_count) / self.view_count) * 100
 
-    @property
+    @cached_property
     def like_ratio(self) -> float:
         """Calculate like ratio (likes / views)"""
         if self.view_count == 0:
             return 0.0
         return (self.like_count / self.view_count) * 100
 
+    @cached_property
+    def published_ts(self) -> float:
+        """Publication time as a POSIX timestamp (cheap numeric compares in list scans)"""
+        return self.published_at.timestamp()
+
+    @cached_property
+    def published_date(self) -> str:
+        """Publication date as YYYY-MM-DD (strftime is costly for list renders)"""
+        return self.published_at.strftime("%Y-%m-%d")
+
+    @cached_property
+    def views_display(self) -> str:
+        """View count in compact form (e.g. 1.2M)"""
+        return compact_count(self.view_count)
+
+    @cached_property
+    def likes_display(self) -> str:
+        """Like count in compact form (e.g. 15.3K)"""
+        return compact_count(self.like_count)
+
+    @cached_property
+    def display_title(self) -> str:
+        """Title clipped to the sidebar column width"""
+        return _clip(self.title, 17)
+
+    @cached_property
+    def display_title_new(self) -> str:
+        """Title with the recent-video badge, clipped to the sidebar column width"""
+        return _clip(f"🆕 {self.title}", 17)
+
+    @cached_property
+    def views_cell(self) -> str:
+        """View count as a colored table cell"""
+        return f"[yellow]{self.views_display}[/yellow]"
+
+    @cached_property
+    def likes_cell(self) -> str:
+        """Like count as a colored table cell"""
+        return f"[green]{self.likes_display}[/green]"
+
+    @cached_property
+    def details_markup(self) -> str:
+        """All stats of the video for the details panel (Rich markup)"""
+        views = max(self.view_count, 1)
+        return _VIDEO_DETAILS_TEMPLATE.format_map({
+            "title": self.title[:25],
+            "published": self.published_date,
+            "duration": self.formatted_duration,
+            "views": self.view_count,
+            "likes": self.like_count,
+            "comments": self.comment_count,
+            "engagement_rate": (self.like_count / views) * 100,
+            "comments_per_1k": (self.comment_count / views) * 1000,
+        })
+
     @property
     def formatted_duration(self) -> str:
         """Format ISO 8601 duration to human-readable format (HH:MM:SS or MM:SS)"""
-        import re
-
         # Parse ISO 8601 duration format (e.g., PT1H2M30S, PT45M12S, PT30S)
-        match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', self.duration)
-        if not match:
+        # with plain str.partition calls - much cheaper than a regex for such short strings
+        if not self.duration.startswith('PT'):
             return self.duration  # Return as-is if format not recognized
 
-        hours = int(match.group(1) or 0)
-        minutes = int(match.group(2) or 0)
-        seconds = int(match.group(3) or 0)
+        rest = self.duration[2:]
+        hours_str, sep, rest = rest.partition('H')
+        if not sep:
+            hours_str, rest = '', hours_str
+        minutes_str, sep, rest = rest.partition('M')
+        if not sep:
+            minutes_str, rest = '', minutes_str
+        seconds_str = rest.partition('S')[0]
+
+        try:
+            hours = int(hours_str) if hours_str else 0
+            minutes = int(minutes_str) if minutes_str else 0
+            seconds = int(seconds_str) if seconds_str else 0
+        except ValueError:
+            return self.duration
 
         # Format based on length
         if hours > 0:
@@ -83,21 +232,25 @@ class Video:
     @property
     def is_recent(self) -> bool:
         """Check if video was published within the last 7 days (not scheduled for future)"""
-        from datetime import datetime, timedelta
-        now = datetime.now(self.published_at.tzinfo) if self.published_at.tzinfo else datetime.now()
+        now = datetime.now(self._tz)
+        return self.is_recent_at(now)
+
+    @property
+    def is_scheduled(self) -> bool:
+        """Check if video is scheduled for future publication"""
+        now = datetime.now(self._tz)
+        return self.is_scheduled_at(now)
 
+    def is_recent_at(self, now: datetime) -> bool:
+        """Check if video was published within the 7 days before `now` (shared clock for list scans)"""
         # Don't mark future/scheduled videos as recent
         if self.published_at > now:
             return False
 
-        seven_days_ago = now - timedelta(days=7)
-        return self.published_at >= seven_days_ago
+        return self.published_at >= now - RECENT_VIDEO_WINDOW
 
-    @property
-    def is_scheduled(self) -> bool:
-        """Check if video is scheduled for future publication"""
-        from datetime import datetime
-        now = datetime.now(self.published_at.tzinfo) if self.published_at.tzinfo else datetime.now()
+    def is_scheduled_at(self, now: datetime) -> bool:
+        """Check if video is scheduled for publication after `now`"""
         return self.published_at > now
 
     def to_dict(self) -> Dict[str, Any]:
@@ -164,10 +317,10 @@ class ChannelTrend:
                 avg_daily_views=0.0
             )
 
-        # Sort by timestamp
-        history = sorted(history, key=lambda s: s.timestamp)
-        oldest = history[0]
-        newest = history[-1]
+        # Only the oldest and newest points matter, no need to sort. Ties resolve like
+        # a stable sort would: the first of the oldest, the last of the newest
+        oldest = min(history, key=_by_timestamp)
+        newest = max(reversed(history), key=_by_timestamp)
 
         # Calculate growth
         sub_growth = newest.subscriber_count - oldest.subscriber_count
@@ -230,26 +383,30 @@ class ChangeDetection:
 
     def get_summary(self) -> str:
         """Get a human-readable summary of changes"""
-        parts = []
+        new_count = len(self.new_videos)
+        updated_count = len(self.updated_videos)
 
-        if self.new_videos:
-            parts.append(f"{len(self.new_videos)} new video{'s' if len(self.new_videos) > 1 else ''}")
-
-        if self.updated_videos:
-            parts.append(f"{len(self.updated_videos)} video{'s' if len(self.updated_videos) > 1 else ''} updated")
+        segments = (
+            f"{new_count} new video{'s' if new_count > 1 else ''}" if new_count else None,
+            f"{updated_count} video{'s' if updated_count > 1 else ''} updated" if updated_count else None,
+            self._channel_summary(),
+        )
+        return " | ".join(segment for segment in segments if segment) or "No changes"
 
-        if self.channel_changes:
-            channel_parts = []
-            if 'subscribers' in self.channel_changes:
-                diff = self.channel_changes['subscribers']
-                channel_parts.append(f"{diff:+,} subscribers")
-            if 'views' in self.channel_changes:
-                diff = self.channel_changes['views']
-                channel_parts.append(f"{diff:+,} views")
-            if channel_parts:
-                parts.append(", ".join(channel_parts))
+    def _channel_summary(self) -> Optional[str]:
+        """Summarize channel metric changes, or None if there are none to show"""
+        changes = self.channel_changes
+        if not changes:
+            return None
 
-        return " | ".join(parts) if parts else "No changes"
+        if 'subscribers' in changes:
+            subs = f"{changes['subscribers']:+,} subscribers"
+            if 'views' in changes:
+                return f"{subs}, {changes['views']:+,} views"
+            return subs
+        if 'views' in changes:
+            return f"{changes['views']:+,} views"
+        return None
 
 
 @dataclass
@@ -262,6 +419,23 @@ class AlertThreshold:
     message: str  # custom message template
     enabled: bool = True
 
+    # Comparison function for each supported operator string
+    OPERATORS = {
+        ">=": ge,
+        "<=": le,
+        ">": gt,
+        "<": lt,
+        "==": eq,
+    }
+
+    def __post_init__(self):
+        """Resolve the operator string to its comparison function once"""
+        self._compare = self.OPERATORS.get(self.operator)
+
+    def check(self, actual: float) -> bool:
+        """Check if actual value meets this threshold (False if disabled or operator unknown)"""
+        return self.enabled and self._compare is not None and self._compare(actual, self.value)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         return asdict(self)
@@ -329,58 +503,80 @@ class VideoFilter:
 
     def is_active(self) -> bool:
         """Check if any filter is active"""
-        return any([
-            self.date_from is not None,
-            self.date_to is not None,
-            self.views_min is not None,
-            self.views_max is not None,
-            self.likes_min is not None,
-            self.likes_max is not None,
-            self.comments_min is not None,
-            self.comments_max is not None,
-            self.engagement_min is not None,
-            self.engagement_max is not None,
-            self.search_text is not None and self.search_text != ""
-        ])
-
-    def matches(self, video: Video) -> bool:
-        """Check if video matches all filter criteria"""
-        # Date range
-        if self.date_from and video.published_at < self.date_from:
-            return False
-        if self.date_to and video.published_at > self.date_to:
-            return False
+        # A predicate is built for every active criterion, so no need to re-check each field
+        return bool(self._predicates)
+
+    def __post_init__(self):
+        """Build the list of predicates for the active criteria only"""
+        # Filters are built once and never mutated, so inactive criteria are
+        # dropped here instead of being re-tested for every video
+        predicates: List[Callable[[Video], bool]] = []
+
+        # Date range (compared as timestamps, bounds converted once)
+        if self.date_from:
+            ts_from = self.date_from.timestamp()
+            predicates.append(lambda v: v.published_ts >= ts_from)
+        if self.date_to:
+            ts_to = self.date_to.timestamp()
+            predicates.append(lambda v: v.published_ts <= ts_to)
 
         # Views range
-        if self.views_min is not None and video.view_count < self.views_min:
-            return False
-        if self.views_max is not None and video.view_count > self.views_max:
-            return False
+        if self.views_min is not None:
+            predicates.append(lambda v, m=self.views_min: v.view_count >= m)
+        if self.views_max is not None:
+            predicates.append(lambda v, m=self.views_max: v.view_count <= m)
 
         # Likes range
-        if self.likes_min is not None and video.like_count < self.likes_min:
-            return False
-        if self.likes_max is not None and video.like_count > self.likes_max:
-            return False
+        if self.likes_min is not None:
+            predicates.append(lambda v, m=self.likes_min: v.like_count >= m)
+        if self.likes_max is not None:
+            predicates.append(lambda v, m=self.likes_max: v.like_count <= m)
 
         # Comments range
-        if self.comments_min is not None and video.comment_count < self.comments_min:
-            return False
-        if self.comments_max is not None and video.comment_count > self.comments_max:
-            return False
-
-        # Engagement rate
-        if self.engagement_min is not None and video.engagement_rate < self.engagement_min:
-            return False
-        if self.engagement_max is not None and video.engagement_rate > self.engagement_max:
-            return False
+        if self.comments_min is not None:
+            predicates.append(lambda v, m=self.comments_min: v.comment_count >= m)
+        if self.comments_max is not None:
+            predicates.append(lambda v, m=self.comments_max: v.comment_count <= m)
+
+        # Engagement rate, compared without dividing:
+        # (likes + comments) / views * 100 >= m  <=>  (likes + comments) * 100 >= m * views
+        # Videos without views have a 0% engagement rate
+        if self.engagement_min is not None:
+            predicates.append(
+                lambda v, m=self.engagement_min: (
+                    (v.like_count + v.comment_count) * 100 >= m * v.view_count if v.view_count else m <= 0
+                )
+            )
+        if self.engagement_max is not None:
+            predicates.append(
+                lambda v, m=self.engagement_max: (
+                    (v.like_count + v.comment_count) * 100 <= m * v.view_count if v.view_count else m >= 0
+                )
+            )
 
         # Text search
-        if self.search_text and self.search_text.lower() not in video.title.lower():
-            return False
+        if self.search_text:
+            search_lower = self.search_text.lower()
+            predicates.append(lambda v: search_lower in v.title.lower())
+
+        self._predicates = predicates
 
+    def matches(self, video: Video) -> bool:
+        """Check if video matches all filter criteria"""
+        for predicate in self._predicates:
+            if not predicate(video):
+                return False
         return True
 
+    def filter_many(self, videos: List[Video]) -> List[Video]:
+        """Return the videos matching all filter criteria (batch version of matches)"""
+        # Apply one criterion at a time over the surviving videos, so each pass
+        # is a tight comprehension over a shrinking list
+        result = list(videos)
+        for predicate in self._predicates:
+            result = [v for v in result if predicate(v)]
+        return result
+
     def get_summary(self) -> str:
         """Get human-readable summary of active filters"""
         parts = []
@@ -431,6 +627,15 @@ class VideoFilter:
         return " | ".join(parts) if parts else "No filters"
 
 
+def pattern_score(video_count: int, avg_views: float, avg_engagement: float, avg_like_ratio: float) -> float:
+    """Calculate overall performance score for a temporal pattern bucket"""
+    if video_count == 0:
+        return 0.0
+    # Weighted score: 40% views, 40% engagement, 20% like ratio
+    normalized_views = min(avg_views / 10000, 10.0)  # Cap at 100K views = 10 points
+    return (normalized_views * 0.4) + (avg_engagement * 0.4) + (avg_like_ratio * 0.2)
+
+
 @dataclass
 class DayOfWeekPattern:
     """Performance pattern for a specific day of the week"""
@@ -441,15 +646,11 @@ class DayOfWeekPattern:
     avg_engagement: float
     avg_like_ratio: float
     total_views: int
+    performance_score: float = field(init=False)
 
-    @property
-    def performance_score(self) -> float:
-        """Calculate overall performance score for this day"""
-        if self.video_count == 0:
-            return 0.0
-        # Weighted score: 40% views, 40% engagement, 20% like ratio
-        normalized_views = min(self.avg_views / 10000, 10.0)  # Cap at 100K views = 10 points
-        return (normalized_views * 0.4) + (self.avg_engagement * 0.4) + (self.avg_like_ratio * 0.2)
+    def __post_init__(self):
+        """Compute the performance score once at construction"""
+        self.performance_score = pattern_score(self.video_count, self.avg_views, self.avg_engagement, self.avg_like_ratio)
 
 
 @dataclass
@@ -461,14 +662,11 @@ class HourOfDayPattern:
     avg_engagement: float
     avg_like_ratio: float
     total_views: int
+    performance_score: float = field(init=False)
 
-    @property
-    def performance_score(self) -> float:
-        """Calculate overall performance score for this hour"""
-        if self.video_count == 0:
-            return 0.0
-        normalized_views = min(self.avg_views / 10000, 10.0)
-        return (normalized_views * 0.4) + (self.avg_engagement * 0.4) + (self.avg_like_ratio * 0.2)
+    def __post_init__(self):
+        """Compute the performance score once at construction"""
+        self.performance_score = pattern_score(self.video_count, self.avg_views, self.avg_engagement, self.avg_like_ratio)
 
 
 @dataclass
@@ -481,14 +679,11 @@ class SeasonalPattern:
     avg_engagement: float
     avg_like_ratio: float
     total_views: int
+    performance_score: float = field(init=False)
 
-    @property
-    def performance_score(self) -> float:
-        """Calculate overall performance score for this month"""
-        if self.video_count == 0:
-            return 0.0
-        normalized_views = min(self.avg_views / 10000, 10.0)
-        return (normalized_views * 0.4) + (self.avg_engagement * 0.4) + (self.avg_like_ratio * 0.2)
+    def __post_init__(self):
+        """Compute the performance score once at construction"""
+        self.performance_score = pattern_score(self.video_count, self.avg_views, self.avg_engagement, self.avg_like_ratio)
 
 
 @dataclass
@@ -544,13 +739,26 @@ class TitlePattern:
     """Analysis of title patterns from successful videos"""
     avg_length: float  # Average title length in characters
     avg_word_count: float  # Average number of words
-    common_words: List[tuple[str, int]]  # (word, frequency) tuples
-    top_keywords: List[tuple[str, float]]  # (keyword, avg_performance_score) tuples
+    # Parallel columns instead of lists of tuples (zipped on demand below)
+    words: List[str]  # Most common words
+    word_counts: List[int]  # Frequency of each word in `words`
+    keywords: List[str]  # Best performing keywords
+    keyword_scores: List[float]  # Average performance score of each keyword in `keywords`
     length_correlation: str  # "short", "medium", "long" - best performing length
 
+    @property
+    def common_words(self) -> List[tuple[str, int]]:
+        """(word, frequency) tuples"""
+        return list(zip(self.words, self.word_counts))
+
+    @property
+    def top_keywords(self) -> List[tuple[str, float]]:
+        """(keyword, avg_performance_score) tuples"""
+        return list(zip(self.keywords, self.keyword_scores))
+
     def get_summary(self) -> str:
         """Get human-readable summary"""
-        top_3_keywords = ", ".join([kw for kw, _ in self.top_keywords[:3]])
+        top_3_keywords = ", ".join(self.keywords[:3])
         return f"Avg length: {self.avg_length:.0f} chars, {self.avg_word_count:.0f} words | Top keywords: {top_3_keywords}"
 
 
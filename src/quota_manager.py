@@ -27,6 +27,9 @@ class QuotaManager:
         'search': 100            # search().list (expensive!)
     }
 
+    # Fixed part of a channel refresh: channels().list + playlistItems().list
+    _CHANNEL_BASE_COST = COSTS['channel_stats'] + COSTS['channel_videos']
+
     def __init__(self, daily_limit: int = 10000, safety_threshold: float = 0.90):
         """
         Initialize quota manager
@@ -41,6 +44,11 @@ class QuotaManager:
         self.last_reset = datetime.now()
         self.usage_history: Dict[str, int] = {}  # Track usage by operation type
 
+    @property
+    def _safe_limit(self) -> int:
+        """Usage ceiling enforced by can_refresh()"""
+        return int(self.daily_limit * self.safety_threshold)
+
     def reset_if_needed(self) -> None:
         """Reset quota if we've crossed into a new day (UTC)"""
         now = datetime.now()
@@ -87,17 +95,24 @@ class QuotaManager:
         if estimated_cost is None:
             estimated_cost = 4
 
-        safe_limit = int(self.daily_limit * self.safety_threshold)
-        return (self.current_usage + estimated_cost) < safe_limit
+        return (self.current_usage + estimated_cost) < self._safe_limit
 
     def get_remaining_quota(self) -> int:
         """Get remaining quota for today"""
         self.reset_if_needed()
-        return max(0, self.daily_limit - self.current_usage)
+        return self._remaining_quota()
 
     def get_usage_percentage(self) -> float:
         """Get current usage as percentage of daily limit"""
         self.reset_if_needed()
+        return self._usage_percentage()
+
+    def _remaining_quota(self) -> int:
+        """Remaining quota for the current usage (caller handles the daily reset)"""
+        return max(0, self.daily_limit - self.current_usage)
+
+    def _usage_percentage(self) -> float:
+        """Current usage as percentage of daily limit (caller handles the daily reset)"""
         return (self.current_usage / self.daily_limit) * 100
 
     def estimate_channel_refresh_cost(self, max_videos: int = 50) -> int:
@@ -110,22 +125,15 @@ class QuotaManager:
         Returns:
             Estimated cost in API units
         """
-        cost = 0
-        cost += self.COSTS['channel_stats']  # 1 unit
-        cost += self.COSTS['channel_videos']  # 1 unit for playlist
-
         # Video details are batched 50 per request
-        video_batches = (max_videos + 49) // 50
-        cost += video_batches * self.COSTS['video_details']
-
-        return cost
+        return self._CHANNEL_BASE_COST + ((max_videos + 49) // 50) * self.COSTS['video_details']
 
     def get_status_summary(self) -> str:
         """Get human-readable status summary"""
         self.reset_if_needed()
 
-        usage_pct = self.get_usage_percentage()
-        remaining = self.get_remaining_quota()
+        usage_pct = self._usage_percentage()
+        remaining = self._remaining_quota()
 
         if usage_pct < 50:
             status = "🟢 Good"
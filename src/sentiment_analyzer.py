@@ -1,61 +1,98 @@
 """Sentiment analysis for YouTube comments using TextBlob"""
 
-from typing import List
-from textblob import TextBlob
+from functools import lru_cache
+from typing import List, Tuple
+from textblob.en import sentiment as _lexicon_sentiment
 
 from .models import Comment
 
 
+# Characters found in TextBlob's letter-free emoticons (":)", "<3", "8)", "*)", ...).
+# Text with neither these nor any letter always scores 0.0.
+_EMOTICON_CHARS = frozenset(":;=<>*8♥❤")
+
+# Default (low, high) polarity band labelled neutral; below is negative, above positive
+NEUTRAL_BAND = (-0.1, 0.1)
+_LABELS = ("negative", "neutral", "positive")
+
+
+@lru_cache(maxsize=8192)
+def _score_text(text: str) -> float:
+    """
+    Compute sentiment polarity for a text
+
+    Results are cached by text, as comment sections repeat the same short comments.
+
+    Args:
+        text: Comment text to analyze
+
+    Returns:
+        Polarity from -1.0 (negative) to 1.0 (positive), 0.0 if analysis fails
+    """
+    # Skip the analyzer for text that cannot carry sentiment ("", "!!!", "🔥🔥🔥")
+    if not text or not any(c.isalpha() or c in _EMOTICON_CHARS for c in text):
+        return 0.0
+
+    try:
+        # Score with TextBlob's English sentiment lexicon directly; it is what
+        # PatternAnalyzer wraps, minus the per-call result object
+        return _lexicon_sentiment(text)[0]
+    except Exception:
+        # If analysis fails, mark as neutral
+        return 0.0
+
+
+def _label(polarity: float, neutral_band: Tuple[float, float]) -> str:
+    """Label a polarity; the neutral band bounds themselves count as neutral"""
+    low, high = neutral_band
+    return _LABELS[(polarity >= low) + (polarity > high)]
+
+
 class SentimentAnalyzer:
     """Analyzer for determining sentiment of text comments"""
 
     @staticmethod
-    def analyze_comment(comment: Comment) -> Comment:
+    def analyze_comment(comment: Comment, neutral_band: Tuple[float, float] = NEUTRAL_BAND) -> Comment:
         """
         Analyze sentiment of a single comment and update its sentiment fields
 
         Args:
             comment: Comment object to analyze
+            neutral_band: (low, high) polarity range labelled neutral
 
         Returns:
             Comment object with updated sentiment_score and sentiment_label
         """
-        try:
-            # Use TextBlob for sentiment analysis
-            blob = TextBlob(comment.text)
-            polarity = blob.sentiment.polarity  # Range: -1.0 (negative) to 1.0 (positive)
-
-            # Determine sentiment label based on polarity
-            if polarity > 0.1:
-                label = "positive"
-            elif polarity < -0.1:
-                label = "negative"
-            else:
-                label = "neutral"
-
-            # Update comment with sentiment data
-            comment.sentiment_score = polarity
-            comment.sentiment_label = label
-
-        except Exception:
-            # If analysis fails, mark as neutral
-            comment.sentiment_score = 0.0
-            comment.sentiment_label = "neutral"
-
+        comment.sentiment_score = _score_text(comment.text)
+        comment.sentiment_label = _label(comment.sentiment_score, neutral_band)
         return comment
 
     @staticmethod
-    def analyze_comments(comments: List[Comment]) -> List[Comment]:
+    def analyze_comments(comments: List[Comment],
+                         neutral_band: Tuple[float, float] = NEUTRAL_BAND) -> List[Comment]:
         """
         Analyze sentiment for multiple comments
 
+        Each distinct text is scored and labelled once.
+
         Args:
             comments: List of Comment objects to analyze
+            neutral_band: (low, high) polarity range labelled neutral
 
         Returns:
             List of Comment objects with updated sentiment data
         """
-        return [SentimentAnalyzer.analyze_comment(comment) for comment in comments]
+        # Label each distinct score once, then fan out to the comments
+        results = {}
+        for comment in comments:
+            text = comment.text
+            result = results.get(text)
+            if result is None:
+                score = _score_text(text)
+                result = results[text] = (score, _label(score, neutral_band))
+            comment.sentiment_score, comment.sentiment_label = result
+
+        return comments
 
     @staticmethod
     def get_sentiment_summary(comments: List[Comment]) -> dict:
@@ -1,8 +1,8 @@
 """Temporal analysis for video publication patterns"""
 
-from typing import List, Dict
-from collections import defaultdict
+from typing import List
 from datetime import datetime
+from operator import attrgetter
 import calendar
 
 from .models import (
@@ -14,6 +14,13 @@ from .models import (
 )
 
 
+# Localized names resolved once instead of on every calendar lookup
+_DAY_NAMES = tuple(calendar.day_name)
+_MONTH_NAMES = tuple(calendar.month_name)
+
+_by_performance_score = attrgetter('performance_score')
+
+
 class TemporalAnalyzer:
     """Analyze video publication patterns and performance by time"""
 
@@ -21,25 +28,80 @@ class TemporalAnalyzer:
         """Initialize analyzer with list of videos"""
         self.videos = videos
 
+    @property
+    def videos(self) -> List[Video]:
+        """Videos being analyzed"""
+        return self._videos
+
+    @videos.setter
+    def videos(self, videos: List[Video]) -> None:
+        """Take a new video list, dropping the aggregates of the previous one"""
+        self._videos = videos
+        self._aggregates = None  # Per-bucket totals of self.videos, see _aggregate_all()
+        self._aggregated_count = 0  # len(self.videos) when the totals were computed
+
+    def _aggregate_all(self):
+        """
+        Aggregate videos by day of week, hour and month in a single pass
+
+        Each result is a (counts, view sums, engagement sums, like ratio sums) tuple
+        of flat per-bucket lists (days 0 = Monday, hours 0-23, months 0 = January).
+        Only these totals are kept, not the videos in each bucket. They are recomputed
+        when a new list is assigned to self.videos or the list grows or shrinks;
+        reassign the list after editing videos in place.
+        """
+        if self._aggregates is not None and self._aggregated_count == len(self._videos):
+            return self._aggregates
+
+        day_count, day_view_sum, day_eng_sum, day_like_sum = [0] * 7, [0] * 7, [0.0] * 7, [0.0] * 7
+        hour_count, hour_view_sum, hour_eng_sum, hour_like_sum = [0] * 24, [0] * 24, [0.0] * 24, [0.0] * 24
+        month_count, month_view_sum, month_eng_sum, month_like_sum = [0] * 12, [0] * 12, [0.0] * 12, [0.0] * 12
+
+        for video in self._videos:
+            published_at = video.published_at
+            views = video.view_count
+            engagement = video.engagement_rate
+            like_ratio = video.like_ratio
+
+            day = published_at.weekday()
+            day_count[day] += 1
+            day_view_sum[day] += views
+            day_eng_sum[day] += engagement
+            day_like_sum[day] += like_ratio
+
+            hour = published_at.hour
+            hour_count[hour] += 1
+            hour_view_sum[hour] += views
+            hour_eng_sum[hour] += engagement
+            hour_like_sum[hour] += like_ratio
+
+            month = published_at.month - 1
+            month_count[month] += 1
+            month_view_sum[month] += views
+            month_eng_sum[month] += engagement
+            month_like_sum[month] += like_ratio
+
+        self._aggregates = (
+            (day_count, day_view_sum, day_eng_sum, day_like_sum),
+            (hour_count, hour_view_sum, hour_eng_sum, hour_like_sum),
+            (month_count, month_view_sum, month_eng_sum, month_like_sum),
+        )
+        self._aggregated_count = len(self._videos)
+        return self._aggregates
+
     def analyze_day_of_week(self) -> List[DayOfWeekPattern]:
         """Analyze video performance by day of week"""
-        # Group videos by day of week
-        day_data: Dict[int, List[Video]] = defaultdict(list)
-
-        for video in self.videos:
-            # Get day of week (0 = Monday, 6 = Sunday)
-            day_idx = video.published_at.weekday()
-            day_data[day_idx].append(video)
+        counts, view_sums, engagement_sums, like_sums = self._aggregate_all()[0]
 
-        # Calculate patterns for each day
-        patterns = []
+        # Calculate patterns for each day (0 = Monday, 6 = Sunday)
+        patterns: list = [None] * 7
         for day_idx in range(7):
-            videos_on_day = day_data[day_idx]
-            day_name = calendar.day_name[day_idx]
+            video_count = counts[day_idx]
+            day_name = _DAY_NAMES[day_idx]
 
-            if not videos_on_day:
+            if not video_count:
                 # No videos on this day
-                patterns.append(DayOfWeekPattern(
+                patterns[day_idx] = DayOfWeekPattern(
                     day_name=day_name,
                     day_index=day_idx,
                     video_count=0,
@@ -47,88 +109,78 @@ class TemporalAnalyzer:
                     avg_engagement=0.0,
                     avg_like_ratio=0.0,
                     total_views=0
-                ))
+                )
                 continue
 
             # Calculate metrics
-            total_views = sum(v.view_count for v in videos_on_day)
-            avg_views = total_views / len(videos_on_day)
-            avg_engagement = sum(v.engagement_rate for v in videos_on_day) / len(videos_on_day)
-            avg_like_ratio = sum(v.like_ratio for v in videos_on_day) / len(videos_on_day)
+            total_views = view_sums[day_idx]
+            avg_views = total_views / video_count
+            avg_engagement = engagement_sums[day_idx] / video_count
+            avg_like_ratio = like_sums[day_idx] / video_count
 
-            patterns.append(DayOfWeekPattern(
+            patterns[day_idx] = DayOfWeekPattern(
                 day_name=day_name,
                 day_index=day_idx,
-                video_count=len(videos_on_day),
+                video_count=video_count,
                 avg_views=avg_views,
                 avg_engagement=avg_engagement,
                 avg_like_ratio=avg_like_ratio,
                 total_views=total_views
-            ))
+            )
 
         return patterns
 
     def analyze_hour_of_day(self) -> List[HourOfDayPattern]:
         """Analyze video performance by hour of day"""
-        # Group videos by hour
-        hour_data: Dict[int, List[Video]] = defaultdict(list)
-
-        for video in self.videos:
-            hour = video.published_at.hour
-            hour_data[hour].append(video)
+        counts, view_sums, engagement_sums, like_sums = self._aggregate_all()[1]
 
         # Calculate patterns for each hour
-        patterns = []
+        patterns: list = [None] * 24
         for hour in range(24):
-            videos_at_hour = hour_data[hour]
+            video_count = counts[hour]
 
-            if not videos_at_hour:
+            if not video_count:
                 # No videos at this hour
-                patterns.append(HourOfDayPattern(
+                patterns[hour] = HourOfDayPattern(
                     hour=hour,
                     video_count=0,
                     avg_views=0.0,
                     avg_engagement=0.0,
                     avg_like_ratio=0.0,
                     total_views=0
-                ))
+                )
                 continue
 
             # Calculate metrics
-            total_views = sum(v.view_count for v in videos_at_hour)
-            avg_views = total_views / len(videos_at_hour)
-            avg_engagement = sum(v.engagement_rate for v in videos_at_hour) / len(videos_at_hour)
-            avg_like_ratio = sum(v.like_ratio for v in videos_at_hour) / len(videos_at_hour)
+            total_views = view_sums[hour]
+            avg_views = total_views / video_count
+            avg_engagement = engagement_sums[hour] / video_count
+            avg_like_ratio = like_sums[hour] / video_count
 
-            patterns.append(HourOfDayPattern(
+            patterns[hour] = HourOfDayPattern(
                 hour=hour,
-                video_count=len(videos_at_hour),
+                video_count=video_count,
                 avg_views=avg_views,
                 avg_engagement=avg_engagement,
                 avg_like_ratio=avg_like_ratio,
                 total_views=total_views
-            ))
+            )
 
         return patterns
 
     def analyze_seasonal_patterns(self) -> List[SeasonalPattern]:
         """Analyze video performance by month (seasonal patterns)"""
-        # Group videos by month
-        month_data: Dict[int, List[Video]] = defaultdict(list)
-
-        for video in self.videos:
-            month = video.published_at.month
-            month_data[month].append(video)
+        counts, view_sums, engagement_sums, like_sums = self._aggregate_all()[2]
 
         # Calculate patterns for each month
-        patterns = []
+        patterns: list = [None] * 12
         for month in range(1, 13):
-            videos_in_month = month_data[month]
-            month_name = calendar.month_name[month]
+            video_count = counts[month - 1]
+            month_name = _MONTH_NAMES[month]
 
-            if not videos_in_month:
+            if not video_count:
                 # No videos in this month
-                patterns.append(SeasonalPattern(
+                patterns[month - 1] = SeasonalPattern(
                     month=month,
                     month_name=month_name,
                     video_count=0,
@@ -136,24 +188,24 @@ class TemporalAnalyzer:
                     avg_engagement=0.0,
                     avg_like_ratio=0.0,
                     total_views=0
-                ))
+                )
                 continue
 
             # Calculate metrics
-            total_views = sum(v.view_count for v in videos_in_month)
-            avg_views = total_views / len(videos_in_month)
-            avg_engagement = sum(v.engagement_rate for v in videos_in_month) / len(videos_in_month)
-            avg_like_ratio = sum(v.like_ratio for v in videos_in_month) / len(videos_in_month)
+            total_views = view_sums[month - 1]
+            avg_views = total_views / video_count
+            avg_engagement = engagement_sums[month - 1] / video_count
+            avg_like_ratio = like_sums[month - 1] / video_count
 
-            patterns.append(SeasonalPattern(
+            patterns[month - 1] = SeasonalPattern(
                 month=month,
                 month_name=month_name,
-                video_count=len(videos_in_month),
+                video_count=video_count,
                 avg_views=avg_views,
                 avg_engagement=avg_engagement,
                 avg_like_ratio=avg_like_ratio,
                 total_views=total_views
-            ))
+            )
 
         return patterns
 
@@ -170,24 +222,24 @@ class TemporalAnalyzer:
 
         # Find best and worst patterns
         if valid_day_patterns:
-            best_day = max(valid_day_patterns, key=lambda p: p.performance_score)
-            worst_day = min(valid_day_patterns, key=lambda p: p.performance_score)
+            best_day = max(valid_day_patterns, key=_by_performance_score)
+            worst_day = min(valid_day_patterns, key=_by_performance_score)
         else:
             # Default values if no data
             best_day = DayOfWeekPattern("Monday", 0, 0, 0.0, 0.0, 0.0, 0)
             worst_day = DayOfWeekPattern("Sunday", 6, 0, 0.0, 0.0, 0.0, 0)
 
         if valid_hour_patterns:
-            best_hour = max(valid_hour_patterns, key=lambda p: p.performance_score)
-            worst_hour = min(valid_hour_patterns, key=lambda p: p.performance_score)
+            best_hour = max(valid_hour_patterns, key=_by_performance_score)
+            worst_hour = min(valid_hour_patterns, key=_by_performance_score)
         else:
             # Default values if no data
             best_hour = HourOfDayPattern(12, 0, 0.0, 0.0, 0.0, 0)
             worst_hour = HourOfDayPattern(0, 0, 0.0, 0.0, 0.0, 0)
 
         if valid_month_patterns:
-            best_month = max(valid_month_patterns, key=lambda p: p.performance_score)
-            worst_month = min(valid_month_patterns, key=lambda p: p.performance_score)
+            best_month = max(valid_month_patterns, key=_by_performance_score)
+            worst_month = min(valid_month_patterns, key=_by_performance_score)
         else:
             # Default values if no data
             best_month = SeasonalPattern(1, "January", 0, 0.0, 0.0, 0.0, 0)
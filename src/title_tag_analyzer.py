@@ -1,17 +1,34 @@
 """Title and tag analysis for video optimization"""
 
 from typing import List, Dict
-from collections import Counter
+from heapq import nlargest, nsmallest
+from operator import itemgetter
 import re
 
 from .models import Video, TitlePattern, TagAnalysis, TitleTagInsights
 
 
+# Runs of anything other than word characters and whitespace
+_PUNCT_RE = re.compile(r'[^\w\s]+')
+
+
+def _nth_largest(values: List[float], index: int) -> float:
+    """
+    Return values sorted in descending order at position index, without a full sort
+
+    Selects from whichever end of the ordering is closer, so the heap stays small.
+    """
+    count = len(values)
+    if index + 1 <= count - index:
+        return nlargest(index + 1, values)[-1]
+    return nsmallest(count - index, values)[-1]
+
+
 class TitleTagAnalyzer:
     """Analyze video titles and tags to identify successful patterns"""
 
     # Common stop words to filter out (English and French)
-    STOP_WORDS = {
+    STOP_WORDS = frozenset({
         'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
         'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
         'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
@@ -21,7 +38,7 @@ class TitleTagAnalyzer:
         'le', 'la', 'les', 'un', 'une', 'des', 'de', 'du', 'et', 'ou', 'mais',
         'pour', 'dans', 'sur', 'avec', 'par', 'est', 'sont', 'a', 'ai', 'as',
         'ont', 'ce', 'cette', 'ces', 'qui', 'que', 'quoi', 'où', 'comment'
-    }
+    })
 
     def __init__(self, videos: List[Video], performance_threshold_percentile: float = 0.6):
         """
@@ -46,14 +63,8 @@ class TitleTagAnalyzer:
 
     def _extract_keywords(self, title: str) -> List[str]:
         """Extract meaningful keywords from a title"""
-        # Convert to lowercase
-        title = title.lower()
-
-        # Remove special characters, keep only alphanumeric and spaces
-        title = re.sub(r'[^\w\s]', ' ', title)
-
-        # Split into words
-        words = title.split()
+        # Lowercase, replace special characters with spaces and split into words
+        words = _PUNCT_RE.sub(' ', title.lower()).split()
 
         # Filter out stop words and very short words
         keywords = [
@@ -69,8 +80,10 @@ class TitleTagAnalyzer:
             return TitlePattern(
                 avg_length=0.0,
                 avg_word_count=0.0,
-                common_words=[],
-                top_keywords=[],
+                words=[],
+                word_counts=[],
+                keywords=[],
+                keyword_scores=[],
                 length_correlation="medium"
             )
 
@@ -78,12 +91,13 @@ class TitleTagAnalyzer:
         video_scores = [(v, self._calculate_performance_score(v)) for v in self.videos]
 
         # Determine threshold for "successful" videos
-        scores = sorted([score for _, score in video_scores], reverse=True)
+        scores = [score for _, score in video_scores]
         threshold_index = int(len(scores) * self.performance_threshold_percentile)
-        threshold_score = scores[threshold_index] if threshold_index < len(scores) else 0
+        threshold_score = _nth_largest(scores, threshold_index) if threshold_index < len(scores) else 0
 
-        # Filter successful videos
-        successful_videos = [v for v, score in video_scores if score >= threshold_score]
+        # Filter successful videos, keeping their scores for the keyword pass
+        successful_with_scores = [(v, score) for v, score in video_scores if score >= threshold_score]
+        successful_videos = [v for v, _ in successful_with_scores]
 
         # Analyze title lengths
         title_lengths = [len(v.title) for v in successful_videos]
@@ -93,31 +107,29 @@ class TitleTagAnalyzer:
         word_counts = [len(v.title.split()) for v in successful_videos]
         avg_word_count = sum(word_counts) / len(word_counts)
 
-        # Extract and count keywords
-        all_keywords = []
-        keyword_scores: Dict[str, List[float]] = {}
-
-        for video in successful_videos:
-            keywords = self._extract_keywords(video.title)
-            all_keywords.extend(keywords)
+        # Count keywords and accumulate their scores as running sums
+        keyword_counts: Dict[str, int] = {}
+        keyword_sums: Dict[str, float] = {}
 
-            score = self._calculate_performance_score(video)
-            for keyword in keywords:
-                if keyword not in keyword_scores:
-                    keyword_scores[keyword] = []
-                keyword_scores[keyword].append(score)
+        for video, score in successful_with_scores:
+            for keyword in self._extract_keywords(video.title):
+                keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
+                keyword_sums[keyword] = keyword_sums.get(keyword, 0.0) + score
 
         # Most common words
-        word_freq = Counter(all_keywords)
-        common_words = word_freq.most_common(20)
+        common_words = nlargest(20, keyword_counts.items(), key=itemgetter(1))
+        words = [word for word, _ in common_words]
+        word_counts = [count for _, count in common_words]
 
         # Keywords with best average performance
         keyword_avg_scores = {
-            kw: sum(scores) / len(scores)
-            for kw, scores in keyword_scores.items()
-            if len(scores) >= 2  # Only keywords that appear in at least 2 videos
+            kw: total / keyword_counts[kw]
+            for kw, total in keyword_sums.items()
+            if keyword_counts[kw] >= 2  # Only keywords that appear in at least 2 videos
         }
-        top_keywords = sorted(keyword_avg_scores.items(), key=lambda x: x[1], reverse=True)[:15]
+        top_keywords = nlargest(15, keyword_avg_scores.items(), key=itemgetter(1))
+        keywords = [kw for kw, _ in top_keywords]
+        keyword_scores = [score for _, score in top_keywords]
 
         # Determine best length category
         # Group by length: short (<40), medium (40-70), long (>70)
@@ -136,13 +148,15 @@ class TitleTagAnalyzer:
             group: (sum(scores) / len(scores) if scores else 0)
             for group, scores in length_groups.items()
         }
-        length_correlation = max(length_avg_scores.items(), key=lambda x: x[1])[0]
+        length_correlation = max(length_avg_scores.items(), key=itemgetter(1))[0]
 
         return TitlePattern(
             avg_length=avg_length,
             avg_word_count=avg_word_count,
-            common_words=common_words,
-            top_keywords=top_keywords,
+            words=words,
+            word_counts=word_counts,
+            keywords=keywords,
+            keyword_scores=keyword_scores,
             length_correlation=length_correlation
         )
 
@@ -151,7 +165,7 @@ class TitleTagAnalyzer:
         title_pattern = self.analyze_title_patterns()
 
         # Extract top keywords as suggestions
-        suggested_keywords = [kw for kw, _ in title_pattern.top_keywords[:10]]
+        suggested_keywords = title_pattern.keywords[:10]
 
         # For tags, we would need tag data from YouTube API
         # Since we don't have it readily available, we'll use an empty list
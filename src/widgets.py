@@ -1,7 +1,15 @@
 """Custom widgets for SuperTube TUI application"""
 
-from datetime import datetime
-from typing import List, Dict, Optional
+import asyncio
+import heapq
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import lru_cache
+from io import StringIO
+from operator import attrgetter
+from typing import List, Dict, Optional, Sequence
+import plotext as plt
 from textual.app import ComposeResult
 from textual.widgets import DataTable, Static, Label
 from textual.containers import Container, Vertical, Horizontal
@@ -10,15 +18,98 @@ from textual.reactive import reactive
 from .models import Channel, Video, Alert, VideoFilter, Comment, VideoSentiment, ChannelSentiment
 
 
+# Sparkline levels, lowest to highest
+SPARKLINE_CHARS = '▁▂▃▄▅▆▇█'
+
+# plotext keeps the current figure in module state; hold this lock around any
+# clf()...show()/build() sequence, as graphs are also rendered in worker threads
+PLOT_LOCK = threading.Lock()
+
+# Shared stand-in for channels without history
+_EMPTY_HISTORY = ()
+
+
+@lru_cache(maxsize=4096)
+def _cfmt(count: int) -> str:
+    """Count with thousands separators (refreshes mostly bring back the same values)"""
+    return format(count, ',')
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Fit text into `limit` characters, ending with '...' when it had to be cut"""
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+def _sync_table_rows(app, table: DataTable, column_keys: Sequence[str],
+                     rendered: Dict[str, tuple], rows: Dict[str, tuple]) -> Dict[str, tuple]:
+    """
+    Bring a DataTable from its `rendered` rows to `rows` (both: row key -> cells, in row order)
+
+    Rows whose position is unchanged are updated cell by cell; removed rows
+    are dropped and new ones appended. Only a change in row order (a re-sort)
+    forces the table to be cleared and rebuilt. Returns the new rendered state.
+    """
+    kept = [row_key for row_key in rows if row_key in rendered]
+    in_place = (
+        kept == [row_key for row_key in rendered if row_key in rows]
+        and kept == list(rows)[:len(kept)]
+    )
+
+    add_row = table.add_row
+    with app.batch_update():
+        if not in_place:
+            table.clear(columns=False)
+            for row_key, cells in rows.items():
+                add_row(*cells, key=row_key)
+        else:
+            for row_key in rendered.keys() - rows.keys():
+                table.remove_row(row_key)
+
+            update_cell = table.update_cell
+            for row_key, cells in rows.items():
+                old_cells = rendered.get(row_key)
+                if old_cells is None:
+                    add_row(*cells, key=row_key)
+                elif old_cells != cells:
+                    for column_key, old, new in zip(column_keys, old_cells, cells):
+                        if old != new:
+                            update_cell(row_key, column_key, new)
+
+    return rows
+
+
 class DashboardWidget(Static):
     """Main dashboard displaying all channels in a structured table"""
 
+    # Column keys, in the order of the cells returned by _build_row()
+    _COLUMN_KEYS = ("channel", "subs", "views", "videos", "trend", "growth")
+
+    # Number of history snapshots whose trend cells are kept
+    TREND_CACHE_SIZE = 256
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.channels: List[Channel] = []
         self.stats_history: Dict[str, List] = {}  # Channel history for trend calculations
+        # Channels as received, with each sort column extracted in that order
+        self._unsorted_channels: List[Channel] = []
+        self._sort_values: Dict[str, list] = {}
+        # Positions of _unsorted_channels in display order, and the (key, reverse, data) they were sorted for
+        self._order: List[int] = []
+        self._order_signature: Optional[tuple] = None
+        self._summary_totals: Optional[tuple] = None  # Totals shown in the summary line
         self.sort_key = "subscribers"  # Default sort by subscribers
         self.sort_reverse = True  # Descending by default
+        self._rendered: Dict[str, tuple] = {}  # Row cells currently in the table, in row order
+        self._row_cache: Dict[str, tuple] = {}  # Row cells by channel id for the current data
+        # (sparkline, growth) cells by history snapshot, kept across refreshes (LRU)
+        self._trend_cache: OrderedDict = OrderedDict()
+        # Styled count cells per channel id, with the counts they were built from
+        self._fmt_cache: Dict[str, tuple] = {}
+        self._table: Optional[DataTable] = None
+        # Data and per-channel history snapshots of the last update_channels() call
+        self._last_signature: Optional[tuple] = None
+        self._last_history_signature: Optional[tuple] = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets"""
@@ -32,21 +123,52 @@ class DashboardWidget(Static):
         # Table setup is now done in update_channels to avoid duplicate column issues
         pass
 
+    def _channels_table(self) -> DataTable:
+        """Get the channels table, queried once and then reused"""
+        if self._table is None:
+            self._table = self.query_one("#channels_table", DataTable)
+        return self._table
+
     def update_channels(self, channels: List[Channel], history: Dict[str, List] = None) -> None:
         """Update the dashboard with channel data"""
+        history = history or {}
+
+        # Timer refreshes often bring back identical data: nothing to redraw then.
+        # The history dict is rebuilt on every load, so it is compared by snapshot, not identity
+        signature = tuple((c.id, c.name, c.subscriber_count, c.view_count, c.video_count) for c in channels)
+        histories = [history.get(channel.id) or _EMPTY_HISTORY for channel in channels]
+        history_keys = [self._history_key(channel, channel_history)
+                        for channel, channel_history in zip(channels, histories)]
+        history_signature = tuple(history_keys)
+        if signature == self._last_signature and history_signature == self._last_history_signature:
+            return
+        self._last_signature = signature
+        self._last_history_signature = history_signature
+
         self.channels = channels
-        self.stats_history = history or {}
+        self._unsorted_channels = list(channels)
+        self._sort_values = {
+            "subscribers": [c.subscriber_count for c in channels],
+            "views": [c.view_count for c in channels],
+            "videos": [c.video_count for c in channels],
+            "name": [c.sort_name for c in channels],
+        }
+
+        self.stats_history = history
+
+        # Build each row's cells once per data update; re-sorts only reorder them
+        self._row_cache = {
+            channel.id: self._build_row(channel, channel_history, history_key)
+            for channel, channel_history, history_key in zip(channels, histories, history_keys)
+        }
 
         # Sort channels before displaying
         self._sort_channels()
 
-        table = self.query_one("#channels_table", DataTable)
+        table = self._channels_table()
 
-        # Clear existing rows (keep columns), but check if columns exist first
-        if table.columns:
-            table.clear(columns=False)
-        else:
-            # Initialize columns if they don't exist yet
+        # Initialize columns if they don't exist yet
+        if not table.columns:
             table.add_column("Channel", key="channel", width=30)
             table.add_column("Subscribers", key="subs", width=15)
             table.add_column("Total Views", key="views", width=15)
@@ -56,36 +178,42 @@ class DashboardWidget(Static):
             table.cursor_type = "row"
             table.focus()
 
-        # Add channel data
-        for channel in self.channels:
-            # Get history for this channel
-            channel_history = self.stats_history.get(channel.id, [])
-
-            # Calculate growth indicator from real data
-            growth_indicator = self._calculate_growth(channel, channel_history)
-            trend_sparkline = self._generate_sparkline(channel, channel_history)
-
-            # Format numbers with separators
-            subs = f"{channel.subscriber_count:,}"
-            views = f"{channel.view_count:,}"
-            videos = f"{channel.video_count:,}"
-
-            # Add row with styled data
-            table.add_row(
-                channel.name,
-                f"[green]{subs}[/green]",
-                f"[yellow]{views}[/yellow]",
-                f"[blue]{videos}[/blue]",
-                trend_sparkline,
-                growth_indicator,
-                key=channel.id
-            )
-
-        # Update summary stats
-        self._update_summary()
-
-    def _calculate_growth(self, channel: Channel, history: List) -> str:
-        """Calculate growth indicator for a channel based on real historical data"""
+        # Rows and summary land in one repaint
+        with self.app.batch_update():
+            self._sync_rows(table)
+
+            # Update summary stats
+            self._update_summary()
+
+    @staticmethod
+    def _history_key(channel: Channel, history: Sequence) -> tuple:
+        """
+        Cache key identifying a channel's history snapshot
+
+        History only grows at the end, and a same-day refresh rewrites the newest
+        point (timestamp and counts), so both ends pin down the rendered cells.
+        """
+        if not history:
+            return (channel.id, 0)
+        first, last = history[0], history[-1]
+        return (channel.id, len(history), first.timestamp, first.subscriber_count,
+                last.timestamp, last.subscriber_count)
+
+    def _trend_cells(self, key: tuple, history: Sequence) -> tuple:
+        """(sparkline, growth) cells of a history snapshot (see _history_key), reused while it is unchanged"""
+        cache = self._trend_cache
+        cells = cache.get(key)
+        if cells is not None:
+            cache.move_to_end(key)
+            return cells
+
+        cells = cache[key] = (self._compute_sparkline(history), self._compute_growth(history))
+        if len(cache) > self.TREND_CACHE_SIZE:
+            cache.popitem(last=False)
+        return cells
+
+    def _compute_growth(self, history: List) -> str:
+        """Format the subscriber growth between the first and last history points"""
         if not history or len(history) < 2:
             return "[dim]—[/dim]"  # Not enough data
 
@@ -110,73 +238,69 @@ class DashboardWidget(Static):
         else:
             return "[dim]━ 0.0%[/dim]"
 
-    def _generate_sparkline(self, channel: Channel, history: List) -> str:
-        """Generate ASCII sparkline for channel trend from real historical data"""
-        sparkline_chars = ['▁', '▂', '▃', '▄', '▅', '▆', '▇', '█']
-
+    def _compute_sparkline(self, history: List) -> str:
+        """Render the last 15 subscriber counts as a sparkline"""
         if not history or len(history) < 2:
             return "[dim]" + "─" * 15 + "[/dim]"  # Not enough data
 
-        # Use up to 15 most recent data points
-        recent_history = history[-15:] if len(history) > 15 else history
-
-        # Extract subscriber counts
-        values = [stat.subscriber_count for stat in recent_history]
+        # Extract subscriber counts from up to 15 most recent data points
+        values = [stat.subscriber_count for stat in history[-15:]]
 
         # Normalize values to sparkline character indices
         min_val = min(values)
-        max_val = max(values)
+        value_range = max(values) - min_val
 
-        if max_val == min_val:
+        if not value_range:
             # All values are the same
-            return sparkline_chars[4] * len(values)  # Middle character
-
-        # Map each value to a sparkline character
-        points = []
-        for val in values:
-            # Normalize to 0-1 range
-            normalized = (val - min_val) / (max_val - min_val)
-            # Map to character index
-            idx = int(normalized * (len(sparkline_chars) - 1))
-            points.append(sparkline_chars[idx])
+            return SPARKLINE_CHARS[4] * len(values)  # Middle character
 
-        return ''.join(points)
+        # Map each value to a character index in integer arithmetic, one pass
+        top = len(SPARKLINE_CHARS) - 1
+        return ''.join([SPARKLINE_CHARS[(val - min_val) * top // value_range] for val in values])
 
     def _update_summary(self) -> None:
         """Update the summary statistics box"""
         if not self.channels:
             return
 
-        total_subs = sum(c.subscriber_count for c in self.channels)
-        total_views = sum(c.view_count for c in self.channels)
-        total_videos = sum(c.video_count for c in self.channels)
+        # Sum the count columns already extracted for sorting, no per-channel attribute reads
+        sort_values = self._sort_values
+        totals = (sum(sort_values["subscribers"]), sum(sort_values["views"]), sum(sort_values["videos"]))
+        if totals == self._summary_totals:
+            return
+        self._summary_totals = totals
+        total_subs, total_views, total_videos = totals
 
         summary = self.query_one("#stats_summary", Static)
         summary.update(
             f"[dim]Total across all channels:[/dim] "
-            f"[green]{total_subs:,}[/green] subscribers | "
-            f"[yellow]{total_views:,}[/yellow] views | "
-            f"[blue]{total_videos:,}[/blue] videos"
+            f"[green]{_cfmt(total_subs)}[/green] subscribers | "
+            f"[yellow]{_cfmt(total_views)}[/yellow] views | "
+            f"[blue]{_cfmt(total_videos)}[/blue] videos"
         )
 
     def get_selected_channel_id(self) -> Optional[str]:
         """Get the currently selected channel ID"""
-        table = self.query_one("#channels_table", DataTable)
+        table = self._channels_table()
         if table.cursor_row >= 0 and table.cursor_row < len(self.channels):
             return self.channels[table.cursor_row].id
         return None
 
     def _sort_channels(self) -> None:
         """Sort channels by current sort key"""
-        sort_keys = {
-            "subscribers": lambda c: c.subscriber_count,
-            "views": lambda c: c.view_count,
-            "videos": lambda c: c.video_count,
-            "name": lambda c: c.name.lower()
-        }
+        values = self._sort_values.get(self.sort_key)
+        if values is None:
+            return
+
+        # Same channel data under the same sort (e.g. only the history changed): same order
+        signature = (self.sort_key, self.sort_reverse, self._last_signature)
+        if signature != self._order_signature:
+            # Order positions by the pre-extracted column instead of calling a key per channel
+            self._order = sorted(range(len(values)), key=values.__getitem__, reverse=self.sort_reverse)
+            self._order_signature = signature
 
-        if self.sort_key in sort_keys:
-            self.channels.sort(key=sort_keys[self.sort_key], reverse=self.sort_reverse)
+        channels = self._unsorted_channels
+        self.channels = [channels[i] for i in self._order]
 
     def change_sort(self, sort_key: str) -> None:
         """Change the sort key and refresh"""
@@ -192,35 +316,36 @@ class DashboardWidget(Static):
 
     def _refresh_table(self) -> None:
         """Refresh the table with current channel data"""
-        table = self.query_one("#channels_table", DataTable)
-
-        # Clear rows and rebuild
-        table.clear(columns=False)
-
-        # Add channel data
-        for channel in self.channels:
-            # Get history for this channel
-            channel_history = self.stats_history.get(channel.id, [])
-
-            # Calculate growth indicator from real data
-            growth_indicator = self._calculate_growth(channel, channel_history)
-            trend_sparkline = self._generate_sparkline(channel, channel_history)
-
-            # Format numbers with separators
-            subs = f"{channel.subscriber_count:,}"
-            views = f"{channel.view_count:,}"
-            videos = f"{channel.video_count:,}"
+        self._sync_rows(self._channels_table())
+
+    def _build_row(self, channel: Channel, channel_history: Sequence, history_key: tuple) -> tuple:
+        """Build the styled cells of a channel row"""
+        # Sparkline and growth indicator from real data
+        trend_sparkline, growth_indicator = self._trend_cells(history_key, channel_history)
+
+        return (channel.name, *self._formatted_counts(channel), trend_sparkline, growth_indicator)
+
+    def _formatted_counts(self, channel: Channel) -> tuple:
+        """Styled subscriber/view/video cells, reformatted only when a count changes"""
+        counts = (channel.subscriber_count, channel.view_count, channel.video_count)
+        cached = self._fmt_cache.get(channel.id)
+        if cached is not None and cached[0] == counts:
+            return cached[1]
+
+        # Format numbers with separators
+        formatted = (
+            f"[green]{_cfmt(counts[0])}[/green]",
+            f"[yellow]{_cfmt(counts[1])}[/yellow]",
+            f"[blue]{_cfmt(counts[2])}[/blue]",
+        )
+        self._fmt_cache[channel.id] = (counts, formatted)
+        return formatted
 
-            # Add row with styled data
-            table.add_row(
-                channel.name,
-                f"[green]{subs}[/green]",
-                f"[yellow]{views}[/yellow]",
-                f"[blue]{videos}[/blue]",
-                trend_sparkline,
-                growth_indicator,
-                key=channel.id
-            )
+    def _sync_rows(self, table: DataTable) -> None:
+        """Bring the table rows in line with self.channels"""
+        row_cache = self._row_cache
+        rows = {channel.id: row_cache[channel.id] for channel in self.channels}
+        self._rendered = _sync_table_rows(self.app, table, self._COLUMN_KEYS, self._rendered, rows)
 
 
 class ChannelDetailWidget(Static):
@@ -244,31 +369,33 @@ class ChannelDetailWidget(Static):
         self.channel = channel
         self.videos = videos
 
-        # Update title
-        title = self.query_one("#channel_title", Label)
-        title.update(f"[bold cyan]📺 {channel.name}[/bold cyan]")
-
-        # Update main stats
-        stats = self.query_one("#channel_stats", Static)
-        stats.update(
-            f"[green]Subscribers:[/green] {channel.subscriber_count:,} | "
-            f"[yellow]Total Views:[/yellow] {channel.view_count:,} | "
-            f"[blue]Videos:[/blue] {channel.video_count:,}"
-        )
+        # Title, stats, info and graph placeholder land in one repaint
+        with self.app.batch_update():
+            # Update title
+            title = self.query_one("#channel_title", Label)
+            title.update(f"[bold cyan]📺 {channel.name}[/bold cyan]")
+
+            # Update main stats
+            stats = self.query_one("#channel_stats", Static)
+            stats.update(
+                f"[green]Subscribers:[/green] {_cfmt(channel.subscriber_count)} | "
+                f"[yellow]Total Views:[/yellow] {_cfmt(channel.view_count)} | "
+                f"[blue]Videos:[/blue] {_cfmt(channel.video_count)}"
+            )
 
-        # Update additional info
-        info = self.query_one("#channel_info", Static)
-        avg_views_per_video = channel.view_count // max(channel.video_count, 1)
-        info.update(
-            f"[bold]Channel Information:[/bold]\n"
-            f"Average views per video: [yellow]{avg_views_per_video:,}[/yellow]\n"
-            f"Total videos: [blue]{len(videos)}[/blue] videos loaded\n\n"
-            f"[dim]{channel.description[:200]}{'...' if len(channel.description) > 200 else ''}[/dim]\n\n"
-            f"[cyan]Press ENTER to view all videos[/cyan]"
-        )
+            # Update additional info
+            info = self.query_one("#channel_info", Static)
+            avg_views_per_video = channel.view_count // max(channel.video_count, 1)
+            info.update(
+                f"[bold]Channel Information:[/bold]\n"
+                f"Average views per video: [yellow]{_cfmt(avg_views_per_video)}[/yellow]\n"
+                f"Total videos: [blue]{len(videos)}[/blue] videos loaded\n\n"
+                f"[dim]{channel.short_description}[/dim]\n\n"
+                f"[cyan]Press ENTER to view all videos[/cyan]"
+            )
 
-        # Update graph
-        self._update_graph()
+            # Update graph
+            self._update_graph()
 
     def _update_graph(self) -> None:
         """Update the trend graph"""
@@ -283,9 +410,6 @@ class ChannelDetailWidget(Static):
 
     async def update_graph_with_history(self, history: list) -> None:
         """Update graph with historical data using plotext"""
-        import plotext as plt
-        from io import StringIO
-
         graph_box = self.query_one("#channel_graph", Static)
 
         if not history or len(history) < 2:
@@ -300,32 +424,8 @@ class ChannelDetailWidget(Static):
         subscribers = [stat.subscriber_count for stat in history]
         views = [stat.view_count for stat in history]
 
-        # Create subscriber graph
-        plt.clf()
-        plt.title("Subscribers (30 days)")
-        plt.plot(dates, subscribers, marker="braille")
-        plt.xlabel("Date")
-        plt.ylabel("Subscribers")
-        plt.theme("dark")
-        plt.plotsize(60, 8)
-
-        # Capture the plot as string
-        buffer = StringIO()
-        plt.show(buffer)
-        sub_graph = buffer.getvalue()
-
-        # Create views graph
-        plt.clf()
-        plt.title("Total Views (30 days)")
-        plt.plot(dates, views, marker="braille", color="yellow")
-        plt.xlabel("Date")
-        plt.ylabel("Views")
-        plt.theme("dark")
-        plt.plotsize(60, 8)
-
-        buffer = StringIO()
-        plt.show(buffer)
-        views_graph = buffer.getvalue()
+        # Render in a worker thread so the UI stays responsive meanwhile
+        sub_graph, views_graph = await asyncio.to_thread(self._render_two_plots, dates, subscribers, views)
 
         # Display both graphs
         graph_box.update(
@@ -333,10 +433,53 @@ class ChannelDetailWidget(Static):
             f"{sub_graph}\n\n{views_graph}"
         )
 
+    @staticmethod
+    def _render_two_plots(dates: List[str], subscribers: List[int], views: List[int]) -> tuple[str, str]:
+        """Render the subscriber and views graphs with plotext"""
+        graphs = []
+        buffer = StringIO()
+        with PLOT_LOCK:
+            # Subscriber graph, then views graph, captured through one reused buffer
+            for title, values, ylabel, color in (
+                ("Subscribers (30 days)", subscribers, "Subscribers", None),
+                ("Total Views (30 days)", views, "Views", "yellow"),
+            ):
+                plt.clf()
+                plt.title(title)
+                if color:
+                    plt.plot(dates, values, marker="braille", color=color)
+                else:
+                    plt.plot(dates, values, marker="braille")
+                plt.xlabel("Date")
+                plt.ylabel(ylabel)
+                plt.theme("dark")
+                plt.plotsize(60, 8)
+
+                # Capture the plot as string
+                buffer.seek(0)
+                buffer.truncate(0)
+                plt.show(buffer)
+                graphs.append(buffer.getvalue())
+
+        return graphs[0], graphs[1]
+
 
 class VideoListWidget(Static):
     """Scrollable and sortable list of videos"""
 
+    # Sort key functions by sort name ("engagement" is likes per view)
+    SORT_KEYS = {
+        "views": attrgetter("view_count"),
+        "likes": attrgetter("like_count"),
+        "comments": attrgetter("comment_count"),
+        "date": attrgetter("published_ts"),
+        "engagement": attrgetter("like_ratio"),
+    }
+
+    # Seconds after the last keystroke before the search is applied,
+    # so typing a word filters once instead of once per letter
+    SEARCH_DELAY = 0.12
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.all_videos: List[Video] = []  # All videos
@@ -344,6 +487,13 @@ class VideoListWidget(Static):
         self.sort_key = "views"
         self.sort_reverse = True
         self.search_text = ""
+        self._prev_search_text = ""  # Search text self.videos was last filtered with
+        self._lower_titles: Dict[str, str] = {}  # Lowercased titles by video id
+        self._display_titles: Dict[tuple, str] = {}  # Title cells by (video id, is recent)
+        # Date, views, likes, comments and engagement cells by video id
+        self._static_cells: Dict[str, tuple] = {}
+        self._table: Optional[DataTable] = None
+        self._search_timer = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets"""
@@ -358,11 +508,32 @@ class VideoListWidget(Static):
         # Table setup is now done in _refresh_table to avoid duplicate column issues
         pass
 
+    def _videos_table(self) -> DataTable:
+        """Get the videos table, queried once and then reused"""
+        if self._table is None:
+            self._table = self.query_one("#videos_table", DataTable)
+        return self._table
+
     def update_videos(self, videos: List[Video], channel_name: str = "") -> None:
         """Update the video list"""
         self.all_videos = videos
-        self.videos = videos.copy()  # Start with all videos
+        self.videos = videos  # Start with all videos (sorting makes the private copy)
         self.channel_name = channel_name
+        self._lower_titles = {video.id: video.title.lower() for video in videos}
+        self._display_titles = {}
+        # Cells that only change with the data, formatted once per load rather than per render
+        self._static_cells = {
+            video.id: (
+                video.published_date,
+                f"[yellow]{_cfmt(video.view_count)}[/yellow]",
+                f"[green]{_cfmt(video.like_count)}[/green]",
+                f"[blue]{_cfmt(video.comment_count)}[/blue]",
+                # Engagement rate (likes/views)
+                f"[magenta]{(video.like_count / max(video.view_count, 1)) * 100:.2f}%[/magenta]",
+            )
+            for video in videos
+        }
+        self._prev_search_text = ""
 
         # Update title
         self._update_title()
@@ -390,17 +561,32 @@ class VideoListWidget(Static):
         from textual.widgets import Input
         if isinstance(event.input, Input) and event.input.id == "video_search_input":
             self.search_text = event.value.lower()
-            self._apply_filter()
+            # Restart the delay: the filter runs once typing pauses, with the latest text
+            if self._search_timer is not None:
+                self._search_timer.stop()
+            self._search_timer = self.set_timer(self.SEARCH_DELAY, self._apply_search)
+
+    def _apply_search(self) -> None:
+        """Apply the search text once typing has paused"""
+        self._search_timer = None
+        self._apply_filter()
 
     def _apply_filter(self) -> None:
         """Apply search filter to videos"""
-        if not self.search_text:
-            self.videos = self.all_videos.copy()
+        search_text = self.search_text
+        if not search_text:
+            self.videos = self.all_videos
         else:
-            self.videos = [
-                video for video in self.all_videos
-                if self.search_text in video.title.lower()
-            ]
+            # While typing, each query extends the last one: only the current
+            # matches can still match, so narrow those instead of rescanning
+            if self._prev_search_text and search_text.startswith(self._prev_search_text):
+                source = self.videos
+            else:
+                source = self.all_videos
+
+            lower_titles = self._lower_titles
+            self.videos = [video for video in source if search_text in lower_titles[video.id]]
+        self._prev_search_text = search_text
 
         self._update_title()
         self._sort_videos()
@@ -416,26 +602,17 @@ class VideoListWidget(Static):
 
     def _sort_videos(self) -> None:
         """Sort videos by current sort key"""
-        sort_keys = {
-            "views": lambda v: v.view_count,
-            "likes": lambda v: v.like_count,
-            "comments": lambda v: v.comment_count,
-            "date": lambda v: v.published_at,
-            "engagement": lambda v: (v.like_count / max(v.view_count, 1)) * 100
-        }
-
-        if self.sort_key in sort_keys:
-            self.videos.sort(key=sort_keys[self.sort_key], reverse=self.sort_reverse)
+        sort_key = self.SORT_KEYS.get(self.sort_key)
+        if sort_key is not None:
+            # sorted() rather than an in-place sort: self.videos may be all_videos itself
+            self.videos = sorted(self.videos, key=sort_key, reverse=self.sort_reverse)
 
     def _refresh_table(self) -> None:
         """Refresh the table with current video data"""
-        table = self.query_one("#videos_table", DataTable)
+        table = self._videos_table()
 
-        # Clear only rows, but check if columns exist first
-        if table.columns:
-            table.clear(columns=False)
-        else:
-            # Initialize columns if they don't exist yet
+        # Initialize columns if they don't exist yet
+        if not table.columns:
             table.add_column("Title", key="title", width=50)
             table.add_column("Published", key="date", width=12)
             table.add_column("Views", key="views", width=12)
@@ -446,35 +623,45 @@ class VideoListWidget(Static):
             table.cursor_type = "row"
             table.focus()
 
+        # Read the clock once for the whole list instead of once per video
+        now = datetime.now(timezone.utc)
+
+        display_titles = self._display_titles
+        static_cells = self._static_cells
+
+        # Build every row first, then swap them into the table in one batch
+        rows = []
         for video in self.videos:
-            # Calculate engagement rate (likes/views)
-            engagement = (video.like_count / max(video.view_count, 1)) * 100
-
-            # Add badge for recent videos
-            title = video.title
-            if video.is_recent:
-                badge = "🆕 "
-                max_title_len = 47
-            else:
-                badge = ""
-                max_title_len = 50
+            # Title cell only changes when the video stops being recent
+            title_key = (video.id, video.is_recent_at(now))
+            display_title = display_titles.get(title_key)
+            if display_title is None:
+                display_title = display_titles[title_key] = self._display_title(video.title, title_key[1])
 
-            # Truncate title considering badge
-            display_title = badge + (title[:max_title_len] + "..." if len(title) > max_title_len else title)
+            rows.append((display_title, *static_cells[video.id]))
 
-            table.add_row(
-                display_title,
-                video.published_at.strftime("%Y-%m-%d"),
-                f"[yellow]{video.view_count:,}[/yellow]",
-                f"[green]{video.like_count:,}[/green]",
-                f"[blue]{video.comment_count:,}[/blue]",
-                f"[magenta]{engagement:.2f}%[/magenta]",
-                key=video.id
-            )
+        # Rows are looked up by cursor position (get_selected_video), so no row keys are needed
+        with self.app.batch_update():
+            table.clear(columns=False)
+            table.add_rows(rows)
+
+    @staticmethod
+    def _display_title(title: str, recent: bool) -> str:
+        """Title cell: badge for recent videos, truncated to fit the column"""
+        # Add badge for recent videos
+        if recent:
+            badge = "🆕 "
+            max_title_len = 47
+        else:
+            badge = ""
+            max_title_len = 50
+
+        # Truncate title considering badge
+        return badge + (title[:max_title_len] + "..." if len(title) > max_title_len else title)
 
     def get_selected_video(self) -> Optional[Video]:
         """Get the currently selected video"""
-        table = self.query_one("#videos_table", DataTable)
+        table = self._videos_table()
         if table.cursor_row >= 0 and table.cursor_row < len(self.videos):
             return self.videos[table.cursor_row]
         return None
@@ -524,11 +711,22 @@ class VideoListWidget(Static):
 class TopFlopWidget(Static):
     """Widget displaying top and bottom performing videos over a period"""
 
+    # "Current" column cell for each metric
+    CURRENT_FORMATTERS = {
+        "views": lambda v: f"[yellow]{_cfmt(v.view_count)}[/yellow]",
+        "likes": lambda v: f"[green]{_cfmt(v.like_count)}[/green]",
+        "comments": lambda v: f"[blue]{_cfmt(v.comment_count)}[/blue]",
+        "engagement": lambda v: f"[magenta]{v.engagement_rate:.2f}%[/magenta]",
+    }
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.channel_name = ""
         self.period_days = 7
         self.metric = "views"
+        # Signatures of the rows last rendered in the top and bottom tables
+        self._top_signature: Optional[tuple] = None
+        self._flop_signature: Optional[tuple] = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets"""
@@ -590,97 +788,78 @@ class TopFlopWidget(Static):
             "ESC to go back[/dim]"
         )
 
-        # Update top videos table
-        self._update_top_table(top_videos)
-
-        # Update bottom videos table
-        self._update_bottom_table(bottom_videos)
-
-    def _update_top_table(self, videos: List[tuple[Video, float]]) -> None:
-        """Update top performers table"""
-        table = self.query_one("#top_videos_table", DataTable)
-
-        # Ensure columns exist (in case on_mount wasn't called due to display=False)
-        if not table.columns:
-            table.add_column("🏆 Top Performers", key="title", width=25)
-            table.add_column("Growth", key="growth", width=10)
-            table.add_column("Current", key="current", width=10)
-
-        table.clear(columns=False)
-
-        if not videos:
-            table.add_row(
-                "[dim]Not enough data yet[/dim]",
-                "[dim]—[/dim]",
-                "[dim]—[/dim]"
-            )
-            return
+        # Update top and bottom videos tables
+        self._top_signature = self._update_perf_table(
+            "top_videos_table", "🏆 Top Performers", top_videos, self._top_signature
+        )
+        self._flop_signature = self._update_perf_table(
+            "bottom_videos_table", "📉 Bottom Performers", bottom_videos, self._flop_signature
+        )
 
-        for video, growth in videos:
-            # Format growth value based on metric
-            if self.metric == "engagement":
-                growth_str = f"[green]+{growth:.2f}%[/green]" if growth > 0 else f"[red]{growth:.2f}%[/red]"
-            else:
-                growth_str = f"[green]+{int(growth):,}[/green]" if growth > 0 else f"[red]{int(growth):,}[/red]"
+    @staticmethod
+    def _format_rate_growth(growth: float) -> str:
+        """Growth cell for percentage metrics (engagement)"""
+        return f"[green]+{growth:.2f}%[/green]" if growth > 0 else f"[red]{growth:.2f}%[/red]"
 
-            # Get current value
-            if self.metric == "views":
-                current = f"[yellow]{video.view_count:,}[/yellow]"
-            elif self.metric == "likes":
-                current = f"[green]{video.like_count:,}[/green]"
-            elif self.metric == "comments":
-                current = f"[blue]{video.comment_count:,}[/blue]"
-            else:  # engagement
-                eng_rate = video.engagement_rate
-                current = f"[magenta]{eng_rate:.2f}%[/magenta]"
+    @staticmethod
+    def _format_count_growth(growth: float) -> str:
+        """Growth cell for count metrics (views, likes, comments)"""
+        return f"[green]+{int(growth):,}[/green]" if growth > 0 else f"[red]{int(growth):,}[/red]"
 
-            # Truncate title to fit in 25-char column
-            title = video.title[:22] + "..." if len(video.title) > 25 else video.title
+    def _update_perf_table(self, table_id: str, header: str, videos: List[tuple[Video, float]],
+                           last_signature: Optional[tuple]) -> tuple:
+        """
+        Update a performers table, skipping the rebuild when nothing changed
 
-            table.add_row(title, growth_str, current, key=video.id)
+        Args:
+            table_id: DOM id of the table
+            header: Title column header, used if the columns are missing
+            videos: (video, growth) pairs to display
+            last_signature: Signature returned by the previous call for this table
 
-    def _update_bottom_table(self, videos: List[tuple[Video, float]]) -> None:
-        """Update bottom performers table"""
-        table = self.query_one("#bottom_videos_table", DataTable)
+        Returns:
+            Signature of the rows now in the table
+        """
+        table = self.query_one(f"#{table_id}", DataTable)
 
         # Ensure columns exist (in case on_mount wasn't called due to display=False)
         if not table.columns:
-            table.add_column("📉 Bottom Performers", key="title", width=25)
+            table.add_column(header, key="title", width=25)
             table.add_column("Growth", key="growth", width=10)
             table.add_column("Current", key="current", width=10)
 
-        table.clear(columns=False)
+        format_current = self.CURRENT_FORMATTERS.get(self.metric, self.CURRENT_FORMATTERS["engagement"])
 
-        if not videos:
-            table.add_row(
-                "[dim]Not enough data yet[/dim]",
-                "[dim]—[/dim]",
-                "[dim]—[/dim]"
-            )
-            return
+        # Same metric, videos, growth and current values: the table is already up to date
+        signature = (self.metric, tuple((v.id, v.title, growth, format_current(v)) for v, growth in videos))
+        if signature == last_signature:
+            return signature
 
-        for video, growth in videos:
-            # Format growth value based on metric
-            if self.metric == "engagement":
-                growth_str = f"[green]+{growth:.2f}%[/green]" if growth > 0 else f"[red]{growth:.2f}%[/red]"
-            else:
-                growth_str = f"[green]+{int(growth):,}[/green]" if growth > 0 else f"[red]{int(growth):,}[/red]"
+        # Clear and refill in one batch so the table is repainted once
+        with self.app.batch_update():
+            table.clear(columns=False)
+
+            if not videos:
+                table.add_row(
+                    "[dim]Not enough data yet[/dim]",
+                    "[dim]—[/dim]",
+                    "[dim]—[/dim]"
+                )
+                return signature
+
+            # Format growth value based on metric, resolved once for all rows
+            format_growth = self._format_rate_growth if self.metric == "engagement" else self._format_count_growth
 
-            # Get current value
-            if self.metric == "views":
-                current = f"[yellow]{video.view_count:,}[/yellow]"
-            elif self.metric == "likes":
-                current = f"[green]{video.like_count:,}[/green]"
-            elif self.metric == "comments":
-                current = f"[blue]{video.comment_count:,}[/blue]"
-            else:  # engagement
-                eng_rate = video.engagement_rate
-                current = f"[magenta]{eng_rate:.2f}%[/magenta]"
+            rows = []
+            for (_, growth), (_, title, _, current) in zip(videos, signature[1]):
+                growth_str = format_growth(growth)
 
-            # Truncate title to fit in 25-char column
-            title = video.title[:22] + "..." if len(video.title) > 25 else video.title
+                # Truncate title to fit in 25-char column
+                rows.append((_truncate(title, 25), growth_str, current))
 
-            table.add_row(title, growth_str, current, key=video.id)
+            table.add_rows(rows)
+
+        return signature
 
 
 # ============================================================================
@@ -693,9 +872,33 @@ class ChannelsListPanel(Static):
 
     selected_channel_id = reactive(None)
 
+    # Sort key functions by sort name
+    SORT_KEYS = {
+        "name": attrgetter("sort_name"),
+        "subs": attrgetter("subscriber_count"),
+    }
+
+    # cycle_sort(): current sort key -> next (sort key, reverse), each with its natural direction
+    _SORT_TRANSITIONS = {
+        "name": ("subs", True),  # High to low
+        "subs": ("name", False),  # A-Z
+    }
+    _SORT_LABELS = {"name": "Name", "subs": "Subscribers"}
+
+    # Column keys, in the order of the row cells built by _refresh_table()
+    _COLUMN_KEYS = ("name", "subs")
+
+    # Seconds a highlight must stay put before the app loads the channel,
+    # so holding an arrow key only loads the row it stops on
+    SELECT_DELAY = 0.05
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.channels: List[Channel] = []
+        self._rendered: Dict[str, tuple] = {}  # Row cells currently in the table, in row order
+        self._table: Optional[DataTable] = None
+        self._select_timer = None
+        self._on_selected = None  # App selection callback, bound at mount
         self.can_focus = True
         self.sort_key = "subs"  # Default sort by subscribers
         self.sort_reverse = True  # Descending by default (most subs first)
@@ -708,10 +911,17 @@ class ChannelsListPanel(Static):
 
     def on_mount(self) -> None:
         """Initialize the table"""
-        table = self.query_one("#channels_panel_table", DataTable)
+        table = self._channels_table()
         table.add_column("Name", key="name", width=20)
         table.add_column("Subs", key="subs", width=10)
         table.focus()
+        self._on_selected = getattr(self.app, "_on_channel_selected", None)
+
+    def _channels_table(self) -> DataTable:
+        """Get the channels table, queried once and then reused"""
+        if self._table is None:
+            self._table = self.query_one("#channels_panel_table", DataTable)
+        return self._table
 
     def update_channels(self, channels: List[Channel]) -> None:
         """Update the channels list"""
@@ -725,63 +935,46 @@ class ChannelsListPanel(Static):
 
     def _sort_channels(self) -> None:
         """Sort channels by current sort key"""
-        sort_keys = {
-            "name": lambda c: c.name.lower(),
-            "subs": lambda c: c.subscriber_count
-        }
-
-        if self.sort_key in sort_keys:
-            self.channels.sort(key=sort_keys[self.sort_key], reverse=self.sort_reverse)
+        sort_key = self.SORT_KEYS.get(self.sort_key)
+        if sort_key is not None:
+            self.channels.sort(key=sort_key, reverse=self.sort_reverse)
 
     def _refresh_table(self) -> None:
         """Refresh the table with current channel data"""
-        table = self.query_one("#channels_panel_table", DataTable)
-        table.clear(columns=False)
+        table = self._channels_table()
+        rows = {}
 
         for channel in self.channels:
-            # Format subscriber count properly
-            if channel.subscriber_count >= 1000000:
-                subs_display = f"{channel.subscriber_count / 1000000:.1f}M"
-            elif channel.subscriber_count >= 1000:
-                subs_display = f"{channel.subscriber_count / 1000:.1f}K"
-            else:
-                subs_display = str(channel.subscriber_count)
+            rows[channel.id] = (channel.display_name, channel.subs_cell)
 
-            table.add_row(
-                channel.name[:18] + ".." if len(channel.name) > 20 else channel.name,
-                f"[green]{subs_display}[/green]",
-                key=channel.id
-            )
+        self._rendered = _sync_table_rows(self.app, table, self._COLUMN_KEYS, self._rendered, rows)
 
     def cycle_sort(self) -> str:
         """Cycle through sort options and return description"""
-        sort_options = ["name", "subs"]
-        current_index = sort_options.index(self.sort_key) if self.sort_key in sort_options else -1
-
-        # Move to next sort option
-        next_index = (current_index + 1) % len(sort_options)
-        self.sort_key = sort_options[next_index]
-
-        # Set sensible default direction for each key
-        if self.sort_key == "name":
-            self.sort_reverse = False  # A-Z
-        else:  # subs
-            self.sort_reverse = True  # High to low
+        self.sort_key, self.sort_reverse = self._SORT_TRANSITIONS.get(
+            self.sort_key, self._SORT_TRANSITIONS["subs"]
+        )
 
         self._sort_channels()
         self._refresh_table()
 
         direction = "↓" if self.sort_reverse else "↑"
-        key_names = {"name": "Name", "subs": "Subscribers"}
-        return f"Sorted by {key_names[self.sort_key]} {direction}"
+        return f"Sorted by {self._SORT_LABELS[self.sort_key]} {direction}"
 
     def on_data_table_row_highlighted(self, event) -> None:
         """Auto-select channel on navigation (lazydocker-style)"""
         if event.cursor_row >= 0 and event.cursor_row < len(self.channels):
             self.selected_channel_id = self.channels[event.cursor_row].id
-            # Notify app about selection change
-            if hasattr(self.app, '_on_channel_selected'):
-                self.app._on_channel_selected(self.selected_channel_id)
+            # Restart the delay: only the row navigation stops on gets loaded
+            if self._select_timer is not None:
+                self._select_timer.stop()
+            self._select_timer = self.set_timer(self.SELECT_DELAY, self._notify_selection)
+
+    def _notify_selection(self) -> None:
+        """Notify app about selection change"""
+        self._select_timer = None
+        if self._on_selected is not None:
+            self._on_selected(self.selected_channel_id)
 
 
 class VideosListPanel(Static):
@@ -789,11 +982,39 @@ class VideosListPanel(Static):
 
     selected_video_id = reactive(None)
 
+    # Sort key functions by sort name
+    SORT_KEYS = {
+        "views": attrgetter("view_count"),
+        "date": attrgetter("published_ts"),
+    }
+
+    # cycle_sort(): current sort key -> next (sort key, reverse), each with its natural direction
+    _SORT_TRANSITIONS = {
+        "views": ("date", True),  # Newest first
+        "date": ("views", True),  # High to low
+    }
+    _SORT_LABELS = {"views": "Views", "date": "Date"}
+
+    # Only this many videos are listed
+    MAX_ROWS = 50
+
+    # Seconds a highlight must stay put before the app loads the video
+    SELECT_DELAY = 0.05
+
+    # Column keys, in the order of the row cells built by _refresh_table()
+    _COLUMN_KEYS = ("title", "views", "likes")
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.all_videos: List[Video] = []  # All videos before filtering
         self.videos: List[Video] = []  # Filtered videos
+        self._visible: List[Video] = []  # Listed videos (first MAX_ROWS in sort order)
         self.filter: VideoFilter = VideoFilter()  # Active filter
+        self._rendered: Dict[str, tuple] = {}  # Row cells currently in the table, in row order
+        self._table: Optional[DataTable] = None
+        self._select_timer = None
+        self._pending_video: Optional[Video] = None
+        self._on_selected = None  # App selection callback, bound at mount
         self.can_focus = True
         self.sort_key = "views"  # Default sort by views
         self.sort_reverse = True  # Descending by default (most views first)
@@ -806,10 +1027,17 @@ class VideosListPanel(Static):
 
     def on_mount(self) -> None:
         """Initialize the table"""
-        table = self.query_one("#videos_panel_table", DataTable)
+        table = self._videos_table()
         table.add_column("Title", key="title", width=18)
         table.add_column("Views", key="views", width=7)
         table.add_column("Likes", key="likes", width=6)
+        self._on_selected = getattr(self.app, "_on_video_selected", None)
+
+    def _videos_table(self) -> DataTable:
+        """Get the videos table, queried once and then reused"""
+        if self._table is None:
+            self._table = self.query_one("#videos_panel_table", DataTable)
+        return self._table
 
     def update_videos(self, videos: List[Video]) -> None:
         """Update the videos list"""
@@ -819,15 +1047,15 @@ class VideosListPanel(Static):
         self._refresh_table()
 
         # Auto-select first video
-        if self.videos and not self.selected_video_id:
-            self.selected_video_id = self.videos[0].id
+        if self._visible and not self.selected_video_id:
+            self.selected_video_id = self._visible[0].id
 
     def _apply_filter(self) -> None:
         """Apply current filter to videos"""
         if not self.filter.is_active():
-            self.videos = self.all_videos.copy()
+            self.videos = self.all_videos
         else:
-            self.videos = [v for v in self.all_videos if self.filter.matches(v)]
+            self.videos = self.filter.filter_many(self.all_videos)
 
     def set_filter(self, filter: VideoFilter) -> None:
         """Set filter and refresh"""
@@ -876,81 +1104,65 @@ class VideosListPanel(Static):
 
     def _sort_videos(self) -> None:
         """Sort videos by current sort key"""
-        sort_keys = {
-            "views": lambda v: v.view_count,
-            "date": lambda v: v.published_at
-        }
-
-        if self.sort_key in sort_keys:
-            self.videos.sort(key=sort_keys[self.sort_key], reverse=self.sort_reverse)
+        sort_key = self.SORT_KEYS.get(self.sort_key)
+        if sort_key is None:
+            self._visible = self.videos[:self.MAX_ROWS]
+        elif len(self.videos) > self.MAX_ROWS:
+            # Only the listed rows need ordering: a heap selection is O(N log k) instead of O(N log N)
+            select = heapq.nlargest if self.sort_reverse else heapq.nsmallest
+            self._visible = select(self.MAX_ROWS, self.videos, key=sort_key)
+        else:
+            self._visible = sorted(self.videos, key=sort_key, reverse=self.sort_reverse)
 
     def _refresh_table(self) -> None:
         """Refresh the table with current video data"""
-        table = self.query_one("#videos_panel_table", DataTable)
-        table.clear(columns=False)
+        table = self._videos_table()
+        rows = {}
 
-        for video in self.videos[:50]:  # Limit to 50 most recent
-            # Add badge for recent videos
-            title = video.title
-            if video.is_recent:
-                badge = "🆕"
-                title = f"{badge} {title}"
-
-            # Truncate title (shorter to accommodate Likes column)
-            display_title = title[:15] + ".." if len(title) > 17 else title
-
-            # Format view count properly
-            if video.view_count >= 1000000:
-                views_display = f"{video.view_count / 1000000:.1f}M"
-            elif video.view_count >= 1000:
-                views_display = f"{video.view_count / 1000:.1f}K"
-            else:
-                views_display = str(video.view_count)
+        # Read the clock once for the whole list instead of once per video
+        now = datetime.now(timezone.utc)
 
-            # Format like count properly
-            if video.like_count >= 1000000:
-                likes_display = f"{video.like_count / 1000000:.1f}M"
-            elif video.like_count >= 1000:
-                likes_display = f"{video.like_count / 1000:.1f}K"
-            else:
-                likes_display = str(video.like_count)
+        for video in self._visible:
+            # Recent videos get the badge; both title variants are cached on the video
+            display_title = video.display_title_new if video.is_recent_at(now) else video.display_title
 
-            table.add_row(
+            rows[video.id] = (
                 display_title,
-                f"[yellow]{views_display}[/yellow]",
-                f"[green]{likes_display}[/green]",
-                key=video.id
+                video.views_cell,
+                video.likes_cell,
             )
 
+        self._rendered = _sync_table_rows(self.app, table, self._COLUMN_KEYS, self._rendered, rows)
+
     def cycle_sort(self) -> str:
         """Cycle through sort options and return description"""
-        sort_options = ["views", "date"]
-        current_index = sort_options.index(self.sort_key) if self.sort_key in sort_options else -1
-
-        # Move to next sort option
-        next_index = (current_index + 1) % len(sort_options)
-        self.sort_key = sort_options[next_index]
-
-        # Set sensible default direction for each key
-        if self.sort_key == "views":
-            self.sort_reverse = True  # High to low
-        else:  # date
-            self.sort_reverse = True  # Newest first
+        self.sort_key, self.sort_reverse = self._SORT_TRANSITIONS.get(
+            self.sort_key, self._SORT_TRANSITIONS["date"]
+        )
 
         self._sort_videos()
         self._refresh_table()
 
         direction = "↓" if self.sort_reverse else "↑"
-        key_names = {"views": "Views", "date": "Date"}
-        return f"Sorted by {key_names[self.sort_key]} {direction}"
+        return f"Sorted by {self._SORT_LABELS[self.sort_key]} {direction}"
 
     def on_data_table_row_highlighted(self, event) -> None:
         """Auto-select video on navigation (lazydocker-style)"""
-        if event.cursor_row >= 0 and event.cursor_row < len(self.videos):
-            self.selected_video_id = self.videos[event.cursor_row].id
-            # Notify app about selection change
-            if hasattr(self.app, '_on_video_selected'):
-                self.app._on_video_selected(self.selected_video_id, self.videos[event.cursor_row])
+        if event.cursor_row >= 0 and event.cursor_row < len(self._visible):
+            video = self._visible[event.cursor_row]
+            self.selected_video_id = video.id
+            # Restart the delay: only the row navigation stops on gets loaded
+            self._pending_video = video
+            if self._select_timer is not None:
+                self._select_timer.stop()
+            self._select_timer = self.set_timer(self.SELECT_DELAY, self._notify_selection)
+
+    def _notify_selection(self) -> None:
+        """Notify app about selection change"""
+        self._select_timer = None
+        video, self._pending_video = self._pending_video, None
+        if video is not None and self._on_selected is not None:
+            self._on_selected(video.id, video)
 
 
 class VideoDetailsPanel(Static):
@@ -959,6 +1171,7 @@ class VideoDetailsPanel(Static):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.current_video: Optional[Video] = None
+        self._content: Optional[Static] = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets"""
@@ -966,39 +1179,43 @@ class VideoDetailsPanel(Static):
             yield Label("[bold cyan]📋 Details[/bold cyan]", classes="panel-title")
             yield Static(id="video_details_content", classes="details-content")
 
+    def _details_content(self) -> Static:
+        """Get the details Static, queried once and then reused"""
+        if self._content is None:
+            self._content = self.query_one("#video_details_content", Static)
+        return self._content
+
     def update_video_details(self, video: Optional[Video]) -> None:
         """Update the video details display - ALL stats"""
         self.current_video = video
-        content = self.query_one("#video_details_content", Static)
+        content = self._details_content()
 
         if not video:
             content.update("[dim]No video selected[/dim]")
             return
 
-        # Calculate engagement metrics
-        engagement_rate = (video.like_count / max(video.view_count, 1)) * 100
-        comments_per_1k = (video.comment_count / max(video.view_count, 1)) * 1000
-
-        # Format counts
-        views_fmt = f"{video.view_count:,}"
-        likes_fmt = f"{video.like_count:,}"
-        comments_fmt = f"{video.comment_count:,}"
-
-        details = f"""[bold]{video.title[:25]}...[/bold]
-{video.published_at.strftime('%Y-%m-%d')} | {video.formatted_duration}
-[yellow]V:[/yellow]{views_fmt} [green]L:[/green]{likes_fmt} [blue]C:[/blue]{comments_fmt}
-[magenta]Rate:[/magenta]{engagement_rate:.1f}% [magenta]C/1k:[/magenta]{comments_per_1k:.0f}"""
-        content.update(details)
+        # Built once per video object (counts never change after construction)
+        content.update(video.details_markup)
 
 
 class MainViewPanel(Static):
     """Main right panel showing contextual views (lazydocker-style)"""
 
+    # Dashboard view layouts, filled with str.format_map
+    _DASHBOARD_TEMPLATE = "{stats}\n{graphs}\n\n[dim]Press 't' for Top/Flop[/dim]"
+    _DASHBOARD_NO_GRAPHS_TEMPLATE = (
+        "{stats}\n[dim yellow]📈 Graphs:[/dim yellow]\n"
+        "[dim]Not enough history yet. Refresh daily to build trend graphs.[/dim]\n\n"
+        "[dim]Press 't' for Top/Flop[/dim]"
+    )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.current_mode = "dashboard"  # "dashboard", "topflop", "temporal", "comparison", "titletag", "projection", "sentiment"
         self.current_channel: Optional[Channel] = None
         self.channel_history: Optional[List] = None
+        self._widgets: Optional[Dict[str, Static]] = None  # Child widget of each mode
+        self._dashboard_render: Optional[tuple] = None  # (channel, history) last drawn by _show_dashboard_view
 
     def compose(self) -> ComposeResult:
         """Create child widgets"""
@@ -1033,73 +1250,27 @@ class MainViewPanel(Static):
         self.channel_history = history
         self.refresh_view()
 
+    def _mode_widgets(self) -> Dict[str, Static]:
+        """Get the child widget shown in each mode, queried once and then reused"""
+        if self._widgets is None:
+            self._widgets = {
+                "dashboard": self.query_one("#main_view_content", Static),
+                "topflop": self.query_one("#topflop_widget", TopFlopWidget),
+                "temporal": self.query_one("#temporal_panel", TemporalAnalysisPanel),
+                "comparison": self.query_one("#comparison_panel", ChannelComparisonPanel),
+                "titletag": self.query_one("#titletag_panel", TitleTagAnalysisPanel),
+                "projection": self.query_one("#projection_panel", GrowthProjectionPanel),
+                "sentiment": self.query_one("#sentiment_panel", ChannelSentimentPanel),
+            }
+        return self._widgets
+
     def _update_visibility(self) -> None:
         """Show/hide widgets based on current mode"""
         try:
-            content = self.query_one("#main_view_content", Static)
-            topflop = self.query_one("#topflop_widget", TopFlopWidget)
-            temporal = self.query_one("#temporal_panel", TemporalAnalysisPanel)
-            comparison = self.query_one("#comparison_panel", ChannelComparisonPanel)
-            titletag = self.query_one("#titletag_panel", TitleTagAnalysisPanel)
-            projection = self.query_one("#projection_panel", GrowthProjectionPanel)
-            sentiment = self.query_one("#sentiment_panel", ChannelSentimentPanel)
-
-            if self.current_mode == "dashboard":
-                content.display = True
-                topflop.display = False
-                temporal.display = False
-                comparison.display = False
-                titletag.display = False
-                projection.display = False
-                sentiment.display = False
-            elif self.current_mode == "topflop":
-                content.display = False
-                topflop.display = True
-                temporal.display = False
-                comparison.display = False
-                titletag.display = False
-                projection.display = False
-                sentiment.display = False
-            elif self.current_mode == "temporal":
-                content.display = False
-                topflop.display = False
-                temporal.display = True
-                comparison.display = False
-                titletag.display = False
-                projection.display = False
-                sentiment.display = False
-            elif self.current_mode == "comparison":
-                content.display = False
-                topflop.display = False
-                temporal.display = False
-                comparison.display = True
-                titletag.display = False
-                projection.display = False
-                sentiment.display = False
-            elif self.current_mode == "titletag":
-                content.display = False
-                topflop.display = False
-                temporal.display = False
-                comparison.display = False
-                titletag.display = True
-                projection.display = False
-                sentiment.display = False
-            elif self.current_mode == "projection":
-                content.display = False
-                topflop.display = False
-                temporal.display = False
-                comparison.display = False
-                titletag.display = False
-                projection.display = True
-                sentiment.display = False
-            elif self.current_mode == "sentiment":
-                content.display = False
-                topflop.display = False
-                temporal.display = False
-                comparison.display = False
-                titletag.display = False
-                projection.display = False
-                sentiment.display = True
+            widgets = self._mode_widgets()
+            if self.current_mode in widgets:
+                for mode, widget in widgets.items():
+                    widget.display = mode == self.current_mode
         except:
             pass
 
@@ -1108,7 +1279,7 @@ class MainViewPanel(Static):
         self._update_visibility()
 
         if self.current_mode == "dashboard":
-            content = self.query_one("#main_view_content", Static)
+            content = self._mode_widgets()["dashboard"]
             self._show_dashboard_view(content)
         elif self.current_mode == "topflop":
             self._show_topflop_view()
@@ -1123,34 +1294,34 @@ class MainViewPanel(Static):
         elif self.current_mode == "sentiment":
             self._show_sentiment_view()
         else:
-            content = self.query_one("#main_view_content", Static)
+            content = self._mode_widgets()["dashboard"]
             content.update(f"[dim]Mode: {self.current_mode}[/dim]")
+            self._dashboard_render = None
 
     def _show_dashboard_view(self, content: Static) -> None:
         """Show dashboard stats and graphs for selected channel"""
+        # Coming back to the dashboard (ESC, D, leaving another mode) with the same channel and
+        # history loaded changes nothing on screen: skip the markup and the graphs.
+        # Compared by identity (O(1)): channels are never mutated and each history load is a new list
+        channel, history = self.current_channel, self.channel_history
+        last = self._dashboard_render
+        if last is not None and last[0] is channel and last[1] is history:
+            return
+        self._dashboard_render = (channel, history)
+
         if not self.current_channel:
             content.update("[dim]Select a channel to view stats[/dim]")
             return
 
-        ch = self.current_channel
-        avg_views = ch.view_count // max(ch.video_count, 1)
-
-        # Build stats section
-        stats_section = f"""[bold cyan]📊 {ch.name}[/bold cyan]
-
-[bold yellow]Stats:[/bold yellow]
-Subscribers:  [green]{ch.subscriber_count:,}[/green]
-Total Views:  [yellow]{ch.view_count:,}[/yellow]
-Videos:       [blue]{ch.video_count:,}[/blue]
-Avg Views/Vid: [yellow]{avg_views:,}[/yellow]
-"""
+        # Built once per channel object (counts never change after construction)
+        stats_section = self.current_channel.stats_markup
 
         # Add graphs if we have history
         if self.channel_history and len(self.channel_history) >= 2:
             graphs = self._generate_channel_graphs()
-            dashboard = f"{stats_section}\n{graphs}\n\n[dim]Press 't' for Top/Flop[/dim]"
+            dashboard = self._DASHBOARD_TEMPLATE.format_map({"stats": stats_section, "graphs": graphs})
         else:
-            dashboard = f"{stats_section}\n[dim yellow]📈 Graphs:[/dim yellow]\n[dim]Not enough history yet. Refresh daily to build trend graphs.[/dim]\n\n[dim]Press 't' for Top/Flop[/dim]"
+            dashboard = self._DASHBOARD_NO_GRAPHS_TEMPLATE.format_map({"stats": stats_section})
 
         content.update(dashboard)
 
@@ -1165,27 +1336,26 @@ Avg Views/Vid: [yellow]{avg_views:,}[/yellow]
                 return self._generate_simple_comparison()
 
             # For larger datasets, use plotext
-            import plotext as plt
-
             # Extract data
             subscribers = [stat.subscriber_count for stat in self.channel_history]
             views = [stat.view_count for stat in self.channel_history]
 
-            # Subscribers graph
-            plt.clf()
-            plt.title("Subscribers Trend (30d)")
-            plt.plot(subscribers, marker="braille", color="green")
-            plt.theme("dark")
-            plt.plotsize(70, 10)
-            subs_graph = plt.build()
-
-            # Views graph
-            plt.clf()
-            plt.title("Total Views Trend (30d)")
-            plt.plot(views, marker="braille", color="yellow")
-            plt.theme("dark")
-            plt.plotsize(70, 10)
-            views_graph = plt.build()
+            with PLOT_LOCK:
+                # Subscribers graph
+                plt.clf()
+                plt.title("Subscribers Trend (30d)")
+                plt.plot(subscribers, marker="braille", color="green")
+                plt.theme("dark")
+                plt.plotsize(70, 10)
+                subs_graph = plt.build()
+
+                # Views graph
+                plt.clf()
+                plt.title("Total Views Trend (30d)")
+                plt.plot(views, marker="braille", color="yellow")
+                plt.theme("dark")
+                plt.plotsize(70, 10)
+                views_graph = plt.build()
 
             return f"[dim yellow]📈 Trends ({len(self.channel_history)} pts):[/dim yellow]\n\n{subs_graph}\n{views_graph}"
 
@@ -1228,7 +1398,7 @@ Change: [{views_color}]{views_sign}{views_change:,}[/{views_color}] ([{views_col
     def _show_topflop_view(self) -> None:
         """Show Top/Flop widget with data"""
         try:
-            topflop = self.query_one("#topflop_widget", TopFlopWidget)
+            topflop = self._mode_widgets()["topflop"]
 
             # Trigger data loading from app if we have a channel selected
             if self.current_channel and hasattr(self.app, 'load_topflop_data'):
@@ -1247,7 +1417,7 @@ Change: [{views_color}]{views_sign}{views_change:,}[/{views_color}] ([{views_col
     def _show_temporal_view(self) -> None:
         """Show Temporal Analysis panel with data"""
         try:
-            temporal = self.query_one("#temporal_panel", TemporalAnalysisPanel)
+            temporal = self._mode_widgets()["temporal"]
 
             # Trigger data loading from app if we have a channel selected
             if self.current_channel and hasattr(self.app, 'load_temporal_data'):
@@ -1263,7 +1433,7 @@ Change: [{views_color}]{views_sign}{views_change:,}[/{views_color}] ([{views_col
     def _show_comparison_view(self) -> None:
         """Show Channel Comparison panel with data"""
         try:
-            comparison = self.query_one("#comparison_panel", ChannelComparisonPanel)
+            comparison = self._mode_widgets()["comparison"]
 
             # Trigger data loading from app
             if hasattr(self.app, 'load_comparison_data'):
@@ -1279,7 +1449,7 @@ Change: [{views_color}]{views_sign}{views_change:,}[/{views_color}] ([{views_col
     def _show_titletag_view(self) -> None:
         """Show Title/Tag Analysis panel with data"""
         try:
-            titletag = self.query_one("#titletag_panel", TitleTagAnalysisPanel)
+            titletag = self._mode_widgets()["titletag"]
 
             # Trigger data loading from app if we have a channel selected
             if self.current_channel and hasattr(self.app, 'load_titletag_data'):
@@ -1295,7 +1465,7 @@ Change: [{views_color}]{views_sign}{views_change:,}[/{views_color}] ([{views_col
     def _show_projection_view(self) -> None:
         """Show Growth Projection panel with data"""
         try:
-            projection = self.query_one("#projection_panel", GrowthProjectionPanel)
+            projection = self._mode_widgets()["projection"]
 
             # Trigger data loading from app if we have a channel selected
             if self.current_channel and hasattr(self.app, 'load_projection_data'):
@@ -1311,7 +1481,7 @@ Change: [{views_color}]{views_sign}{views_change:,}[/{views_color}] ([{views_col
     def _show_sentiment_view(self) -> None:
         """Show Comment Sentiment Analysis panel with data"""
         try:
-            sentiment = self.query_one("#sentiment_panel", ChannelSentimentPanel)
+            sentiment = self._mode_widgets()["sentiment"]
 
             # Trigger data loading from app if we have a channel selected
             if self.current_channel and hasattr(self.app, 'load_sentiment_data'):
@@ -1416,7 +1586,7 @@ class TemporalAnalysisPanel(Static):
         # Day of week patterns (show top 3)
         valid_days = [p for p in day_patterns if p.video_count > 0]
         if valid_days:
-            sorted_days = sorted(valid_days, key=lambda p: p.performance_score, reverse=True)
+            sorted_days = sorted(valid_days, key=attrgetter("performance_score"), reverse=True)
             top_days = sorted_days[:3]
             day_lines = ["[bold]🗓️  Top Days:[/bold]"]
             for i, pattern in enumerate(top_days, 1):
@@ -1429,7 +1599,7 @@ class TemporalAnalysisPanel(Static):
         # Hour of day patterns (show top 3)
         valid_hours = [p for p in hour_patterns if p.video_count > 0]
         if valid_hours:
-            sorted_hours = sorted(valid_hours, key=lambda p: p.performance_score, reverse=True)
+            sorted_hours = sorted(valid_hours, key=attrgetter("performance_score"), reverse=True)
             top_hours = sorted_hours[:3]
             hour_lines = ["[bold]🕐 Top Hours:[/bold]"]
             for i, pattern in enumerate(top_hours, 1):
@@ -1442,7 +1612,7 @@ class TemporalAnalysisPanel(Static):
         # Monthly patterns (show top 3)
         valid_months = [p for p in month_patterns if p.video_count > 0]
         if valid_months:
-            sorted_months = sorted(valid_months, key=lambda p: p.performance_score, reverse=True)
+            sorted_months = sorted(valid_months, key=attrgetter("performance_score"), reverse=True)
             top_months = sorted_months[:3]
             month_lines = ["[bold]📅 Top Months:[/bold]"]
             for i, pattern in enumerate(top_months, 1):
@@ -1461,6 +1631,15 @@ class TemporalAnalysisPanel(Static):
 class ChannelComparisonPanel(Static):
     """Panel showing side-by-side comparison of all channels"""
 
+    # Sort key functions by sort metric (all sorted high to low)
+    SORT_KEYS = {
+        "performance": attrgetter("performance_score"),
+        "subs": attrgetter("subscriber_count"),
+        "engagement": attrgetter("avg_engagement_rate"),
+        "growth": attrgetter("subscriber_growth_percent"),
+        "views": attrgetter("avg_views_per_video"),
+    }
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.comparisons: List = []
@@ -1507,16 +1686,9 @@ class ChannelComparisonPanel(Static):
 
     def _sort_comparisons(self) -> None:
         """Sort comparisons by current metric"""
-        sort_keys = {
-            "performance": lambda c: c.performance_score,
-            "subs": lambda c: c.subscriber_count,
-            "engagement": lambda c: c.avg_engagement_rate,
-            "growth": lambda c: c.subscriber_growth_percent,
-            "views": lambda c: c.avg_views_per_video
-        }
-
-        if self.sort_metric in sort_keys:
-            self.comparisons.sort(key=sort_keys[self.sort_metric], reverse=True)
+        sort_key = self.SORT_KEYS.get(self.sort_metric)
+        if sort_key is not None:
+            self.comparisons.sort(key=sort_key, reverse=True)
 
     def _refresh_table(self) -> None:
         """Refresh the table with current comparison data"""
@@ -1621,9 +1793,9 @@ class TitleTagAnalysisPanel(Static):
         )
 
         # Top keywords section
-        if pattern.top_keywords:
+        if pattern.keywords:
             kw_lines = ["[bold]🔑 Top Performing Keywords:[/bold]"]
-            for i, (keyword, score) in enumerate(pattern.top_keywords[:10], 1):
+            for i, (keyword, score) in enumerate(zip(pattern.keywords[:10], pattern.keyword_scores[:10]), 1):
                 # Color code by score
                 if score >= 7.0:
                     color = "green"
@@ -1635,9 +1807,9 @@ class TitleTagAnalysisPanel(Static):
             sections.append("\n".join(kw_lines))
 
         # Common words section (most frequent)
-        if pattern.common_words:
+        if pattern.words:
             common_lines = ["[bold]💬 Most Common Words:[/bold]"]
-            for i, (word, count) in enumerate(pattern.common_words[:8], 1):
+            for i, (word, count) in enumerate(zip(pattern.words[:8], pattern.word_counts[:8]), 1):
                 common_lines.append(f"{i}. {word} ({count}x)")
             sections.append("\n".join(common_lines))
 
@@ -1848,7 +2020,7 @@ Overall: [{sentiment_color}]{sentiment_icon} {stats.sentiment_label.title()}[/{s
             return
 
         # Sort comments by likes (most liked first)
-        sorted_comments = sorted(self.comments, key=lambda c: c.like_count, reverse=True)
+        sorted_comments = sorted(self.comments, key=attrgetter("like_count"), reverse=True)
 
         for comment in sorted_comments[:50]:  # Limit to 50 comments
             # Truncate author name
@@ -1856,7 +2028,7 @@ Overall: [{sentiment_color}]{sentiment_icon} {stats.sentiment_label.title()}[/{s
 
             # Truncate comment text
             text = comment.text.replace("\n", " ")  # Remove line breaks
-            display_text = text[:47] + "..." if len(text) > 50 else text
+            display_text = _truncate(text, 50)
 
             # Format sentiment with color and icon
             if comment.sentiment_label == "positive":